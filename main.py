@@ -2,6 +2,9 @@
 FastAPI application for processing PDFs with Mistral Document AI.
 Splits PDFs by main outlines and combines results into markdown.
 """
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -11,15 +14,30 @@ from src.api.routes import health, extraction
 from src.core.logging import setup_logging
 from src.core.exceptions import http_exception_handler, validation_exception_handler
 from src.core.middleware import RequestIDMiddleware
+from src.core.process_pool import shutdown_process_pools
+from src.services.client_factory import get_client_factory
+from src.services.workflows import drain_background_tasks
 
 # Configure logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release shared resources on shutdown."""
+    yield
+    # Let pending chunk cleanups finish before the event loop closes
+    await drain_background_tasks()
+    await get_client_factory().close()
+    await asyncio.to_thread(shutdown_process_pools)
+
+
 app = FastAPI(
     title="Michman PDF Extractor",
     description="API for extracting content from PDFs using Mistral Document AI",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Middleware
@@ -12,6 +12,7 @@ from datetime import datetime
 from src.core.security import verify_api_key
 from src.core.error_handling import handle_extraction_errors
 from src.models.api_models import Base64FileRequest, OutlineExtractionResponse
+from src.models.workflow_models import WorkflowResult
 from src.services.workflow_orchestrator import get_workflow_orchestrator
 from src.services.pdf_input_handler import PDFInputHandler
 from src.services.response_builder import ResponseBuilder
@@ -20,6 +21,44 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+async def _extract(
+    pdf_path: str,
+    filename: str,
+    query: str,
+    enable_validation: Optional[bool] = None
+) -> WorkflowResult:
+    """
+    Run the extraction workflow for a PDF already saved to disk.
+
+    Shared by both endpoints after input handling; tests call it directly
+    to exercise the pipeline without the HTTP/ASGI round trip.
+
+    Args:
+        pdf_path: Path to the PDF file
+        filename: Original filename (for logging)
+        query: Query string for workflow selection and outline filtering
+        enable_validation: Enable cross-validation (overrides global setting)
+
+    Returns:
+        WorkflowResult from the selected workflow
+    """
+    logger.info(f"Processing PDF: {filename} with query: {query}")
+
+    result = await get_workflow_orchestrator().execute_workflow(
+        pdf_path=pdf_path,
+        query=query,
+        enable_validation=enable_validation
+    )
+
+    logger.info(
+        f"Successfully processed PDF: {filename}, "
+        f"workflow={result.metadata.get('workflow')}, "
+        f"sections={result.section_count}"
+    )
+
+    return result
+
+
 @router.post("/extract", dependencies=[Depends(verify_api_key)])
 @handle_extraction_errors("Failed to extract PDF content")
 async def extract_pdf_content(
@@ -46,27 +85,16 @@ async def extract_pdf_content(
         Markdown content as single file or ZIP with multiple sections
     """
     pdf_handler = PDFInputHandler()
-    orchestrator = get_workflow_orchestrator()
     response_builder = ResponseBuilder()
 
     try:
         # 1. Save uploaded file
         pdf_path = await pdf_handler.save_uploaded_file(file)
-        logger.info(f"Processing PDF: {file.filename} with query: {query}")
 
         # 2. Execute workflow via orchestrator
-        result = await orchestrator.execute_workflow(
-            pdf_path=pdf_path,
-            query=query,
-            enable_validation=enable_validation
-        )
+        result = await _extract(pdf_path, file.filename, query, enable_validation)
 
         # 3. Build response
-        logger.info(
-            f"Successfully processed PDF: {file.filename}, "
-            f"workflow={result.metadata.get('workflow')}, "
-            f"sections={result.section_count}"
-        )
 
         # Determine workflow suffix for filename
         workflow = result.metadata.get('workflow', '')
@@ -110,7 +138,6 @@ async def extract_pdf_from_base64(request: Base64FileRequest):
         JSON with file metadata and array of extracted content sections
     """
     pdf_handler = PDFInputHandler()
-    orchestrator = get_workflow_orchestrator()
     response_builder = ResponseBuilder()
     request_time = datetime.utcnow()
 
@@ -120,21 +147,11 @@ async def extract_pdf_from_base64(request: Base64FileRequest):
             base64_content=request.file_content,
             filename=request.filename
         )
-        logger.info(f"Processing base64 PDF: {request.filename} with query: {request.query}")
 
         # 2. Execute workflow via orchestrator
-        result = await orchestrator.execute_workflow(
-            pdf_path=pdf_path,
-            query=request.query,
-            enable_validation=request.enable_validation
-        )
+        result = await _extract(pdf_path, request.filename, request.query, request.enable_validation)
 
         # 3. Build JSON response
-        logger.info(
-            f"Successfully processed base64 PDF: {request.filename}, "
-            f"workflow={result.metadata.get('workflow')}, "
-            f"sections={result.section_count}"
-        )
 
         return response_builder.build_json_response(
             result=result,
@@ -34,6 +34,7 @@ class Settings(BaseSettings):
     MISTRAL_API_URL: str = "https://abracrm-4614-resource.services.ai.azure.com/providers/mistral/azure/ocr"
     MISTRAL_MODEL: str = "mistral-document-ai-2505"
     MAX_PAGES_PER_CHUNK: int = 15  # Increased from 10 to 15 for better performance (fewer API calls)
+    MAX_CONCURRENT_CHUNKS: int = 16  # Max chunks of one document processed concurrently
     INCLUDE_IMAGES: bool = False  # Set to True to include image references in output
 
     # Input Guardrails
@@ -54,6 +55,10 @@ class Settings(BaseSettings):
     AZURE_DI_USE_NUMERICAL_VALIDATION: bool = True  # Enable numerical validation for table merging
     AZURE_DI_BALANCE_TOLERANCE: float = 0.01  # Tolerance for balance comparison (for rounding)
 
+    # Text Extraction (pdfplumber) Configuration
+    TEXT_EXTRACTION_WORKERS: int = 8  # Worker processes for page-parallel table extraction (capped at CPU count)
+    TEXT_EXTRACTION_PARALLEL_MIN_PAGES: int = 4  # Smaller PDFs are parsed in-process (pool overhead dominates)
+
     # Query-Workflow Mapping
     # Maps query patterns to processing workflows
     # Workflow options: "text_extraction", "azure_document_intelligence", "mistral", "openai", "gemini", "gemini-wf", "ocr_with_images"
@@ -90,6 +95,9 @@ class Settings(BaseSettings):
     VALIDATION_SIMILARITY_THRESHOLD: float = 0.95  # 95% similarity = 5% error tolerance
     VALIDATION_SIMILARITY_METHOD: str = "number_frequency"  # Options: "number_frequency", "levenshtein"
     VALIDATION_SKIP_SAMPLE_IF_CLEAN: bool = True  # Skip sample validation if no problems detected (optimization)
+    VALIDATION_FETCH_WORKERS: int = 8  # Concurrent validator requests per document (scoring uses one worker per CPU)
+    VALIDATION_SIMILARITY_USE_PROCESSES: bool = True  # Score similarity in a process pool (escapes the GIL); False = thread
+    VALIDATION_CACHE_SIZE: int = 512  # Validator extractions cached by page content hash (0 = disabled)
 
     # Enhanced Validation: Problem Detection (13 patterns)
     # Comma-separated list of enabled problems, or "all" to enable all
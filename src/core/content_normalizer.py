@@ -0,0 +1,153 @@
+"""
+Text normalization utilities for content comparison.
+"""
+import re
+import logging
+from functools import lru_cache
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Inputs longer than this are normalized without caching to keep memory bounded
+_CACHE_MAX_INPUT_CHARS = 65536
+
+_CURRENCY_PATTERN = re.compile(r'[₪$€£¥₹\u20aa]')
+
+# Pattern to match numbers with various formats:
+# - Optional minus sign
+# - Digits with optional thousands separators (comma or period)
+# - Optional decimal part (period or comma as decimal separator)
+# This matches: -1,234.56 or 1.234,56 or 1234 or -123 or 12.5 or 15%
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:[,\.\s]\d{3})*(?:[,\.]\d+)?%?')
+
+
+def _normalize_impl(text: str) -> str:
+    """Keep only alphanumeric characters, lowercased."""
+    # Keep only alphanumeric characters (including Unicode letters and digits)
+    # This works with Hebrew, Arabic, Chinese, etc.
+    return ''.join(char.lower() for char in text if char.isalnum())
+
+
+@lru_cache(maxsize=2048)
+def _normalize_cached(text: str) -> str:
+    return _normalize_impl(text)
+
+
+def _extract_numbers_impl(text: str) -> Tuple[str, ...]:
+    """Extract and normalize numbers (see ContentNormalizer.extract_numbers)."""
+    # Remove currency symbols and common non-numeric characters
+    # Keep: digits, decimal points, commas, minus signs, spaces between digits
+    cleaned = _CURRENCY_PATTERN.sub('', text)
+
+    normalized_numbers = []
+    for match in _NUMBER_PATTERN.findall(cleaned):
+        # Remove percentage sign
+        num = match.rstrip('%')
+
+        # Detect if this is European format (1.234,56) vs US format (1,234.56)
+        # European: period for thousands, comma for decimal
+        # US: comma for thousands, period for decimal
+
+        # Count periods and commas
+        period_count = num.count('.')
+        comma_count = num.count(',')
+
+        if comma_count > 0 and period_count > 0:
+            # Both present - determine which is decimal separator
+            # The last one is usually the decimal separator
+            last_period_pos = num.rfind('.')
+            last_comma_pos = num.rfind(',')
+
+            if last_comma_pos > last_period_pos:
+                # European format: 1.234,56
+                num = num.replace('.', '').replace(',', '.')
+            else:
+                # US format: 1,234.56
+                num = num.replace(',', '')
+        elif comma_count > 0:
+            # Only commas - could be thousands separator or decimal
+            # If only one comma and it's followed by 1-2 digits, it's likely decimal (European)
+            # Otherwise it's thousands separator (US)
+            comma_pos = num.rfind(',')
+            after_comma = num[comma_pos+1:]
+            if comma_count == 1 and len(after_comma) <= 2 and after_comma.isdigit():
+                # Likely European decimal: 123,45
+                num = num.replace(',', '.')
+            else:
+                # US thousands separator: 1,234,567
+                num = num.replace(',', '')
+        # If only periods, assume US format (thousands separator)
+        elif period_count > 1:
+            # Multiple periods = thousands separator: 1.234.567
+            # Keep last period as decimal if followed by 1-2 digits
+            parts = num.split('.')
+            if len(parts[-1]) <= 2:
+                # Last part is decimal
+                num = ''.join(parts[:-1]) + '.' + parts[-1]
+            else:
+                # All are thousands separators
+                num = num.replace('.', '')
+
+        # Remove any remaining spaces
+        num = num.replace(' ', '')
+
+        # Only add if it's a valid number
+        try:
+            # Test if it's parseable as a number
+            float(num)
+            normalized_numbers.append(num)
+        except ValueError:
+            # Skip invalid numbers
+            continue
+
+    return tuple(normalized_numbers)
+
+
+@lru_cache(maxsize=2048)
+def _extract_numbers_cached(text: str) -> Tuple[str, ...]:
+    return _extract_numbers_impl(text)
+
+
+class ContentNormalizer:
+    """Normalize text content for comparison and extract numbers.
+
+    Results are memoized per input string (repeated headers/footers and the same
+    page normalized for both scoring and logging hit the cache). Inputs larger than
+    64 KiB bypass the cache.
+    """
+
+    def normalize_for_comparison(self, text: str) -> str:
+        """
+        Normalize text by keeping only alphanumeric characters.
+        This filters out formatting, punctuation, and whitespace differences.
+
+        Args:
+            text: Text to normalize
+
+        Returns:
+            Text containing only alphanumeric characters (lowercase)
+        """
+        if len(text) > _CACHE_MAX_INPUT_CHARS:
+            return _normalize_impl(text)
+        return _normalize_cached(text)
+
+    def extract_numbers(self, text: str) -> List[str]:
+        """
+        Extract all numbers from text, normalizing format.
+
+        Handles:
+        - Thousands separators: 1,234,567 → 1234567
+        - Decimals: 123.45 → 123.45
+        - Percentages: 15% → 15
+        - Negative numbers: -123 → -123
+        - European format: 1.234.567,89 → 1234567.89
+
+        Args:
+            text: Text to extract numbers from
+
+        Returns:
+            List of normalized number strings
+        """
+        if len(text) > _CACHE_MAX_INPUT_CHARS:
+            return list(_extract_numbers_impl(text))
+        return list(_extract_numbers_cached(text))
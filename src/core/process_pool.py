@@ -0,0 +1,71 @@
+"""
+Shared process pools for CPU-bound work (pdfplumber parsing, similarity scoring).
+
+Pools are created on first use and kept for the life of the process. They use the
+"spawn" start method: the first submit usually comes from an asyncio.to_thread
+worker of the multi-threaded server, and forking a threaded process can leave the
+child holding locks no thread will ever release. Spawned workers import the
+module that defines the submitted function (and its package __init__), once per
+worker; src.services' __init__ imports every client SDK, so prefer light modules.
+"""
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+_pools: Dict[str, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def _init_worker() -> None:
+    """Configure logging in each worker so its records match the server's format."""
+    from src.core.logging import setup_logging
+    setup_logging()
+
+
+def get_process_pool(name: str, max_workers: int) -> ProcessPoolExecutor:
+    """
+    Get the named shared process pool, creating it on first use.
+
+    Args:
+        name: Pool name (one pool per kind of work)
+        max_workers: Worker count used when the pool is created
+
+    Returns:
+        ProcessPoolExecutor backed by spawned workers
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+            _pools[name] = pool
+            logger.info(f"Started '{name}' process pool with {max_workers} workers")
+        return pool
+
+
+def discard_process_pool(name: str) -> None:
+    """
+    Drop the named pool so the next get_process_pool() call starts a fresh one.
+
+    Call after BrokenProcessPool: a broken pool rejects every later submit.
+    """
+    with _pools_lock:
+        pool = _pools.pop(name, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pools() -> None:
+    """Shut down every shared pool and wait for its workers to exit (app shutdown)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -8,11 +8,13 @@ Provides multiple similarity algorithms:
 """
 import math
 import logging
-from typing import Dict, List
+from functools import cache
+from typing import Dict, List, Optional
 from collections import Counter
 import Levenshtein
 
 from src.core.config import settings
+from src.core.content_normalizer import ContentNormalizer
 
 logger = logging.getLogger(__name__)
 
@@ -209,19 +211,20 @@ class SimilarityCalculator:
 
         return intersection / union if union > 0 else 0.0
 
-    def calculate_similarity(self, content1: str, content2: str) -> float:
+    def calculate_similarity(self, content1: str, content2: str, method: Optional[str] = None) -> float:
         """
         Calculate similarity between two strings.
 
         Performance optimization: Uses quick pre-check for early exit on obviously similar content.
 
-        The method used depends on the VALIDATION_SIMILARITY_METHOD setting:
+        The method used defaults to the VALIDATION_SIMILARITY_METHOD setting:
         - "number_frequency": Compare based on number frequency distributions (best for financial data)
         - "levenshtein": Compare based on character-level edit distance (alphanumeric only)
 
         Args:
             content1: First content string
             content2: Second content string
+            method: Similarity method (default: VALIDATION_SIMILARITY_METHOD)
 
         Returns:
             Similarity score between 0.0 and 1.0 (1.0 = identical)
@@ -233,7 +236,7 @@ class SimilarityCalculator:
             return quick_score
 
         # Fall back to full calculation for more accurate scoring
-        method = settings.VALIDATION_SIMILARITY_METHOD
+        method = method or settings.VALIDATION_SIMILARITY_METHOD
 
         if method == "number_frequency":
             return self.calculate_similarity_number_frequency(content1, content2)
@@ -242,3 +245,30 @@ class SimilarityCalculator:
         else:
             logger.warning(f"Unknown similarity method '{method}', falling back to 'number_frequency'")
             return self.calculate_similarity_number_frequency(content1, content2)
+
+
+@cache
+def _worker_calculator() -> SimilarityCalculator:
+    """Calculator shared by every score computed in this process."""
+    return SimilarityCalculator(normalizer=ContentNormalizer())
+
+
+def score_similarity(content1: str, content2: str, method: str) -> float:
+    """
+    Calculate similarity in a process pool worker (module-level so it pickles).
+
+    Lives in src.core, outside src.services, so a spawned worker imports only
+    this module, the normalizer and settings, not every client SDK.
+
+    The caller passes the method because a spawned worker has its own copy of
+    settings, which doesn't see changes made in the server process.
+
+    Args:
+        content1: First content string
+        content2: Second content string
+        method: Similarity method ("number_frequency" or "levenshtein")
+
+    Returns:
+        Similarity score between 0.0 and 1.0
+    """
+    return _worker_calculator().calculate_similarity(content1, content2, method)
@@ -2,12 +2,41 @@ import base64
 import asyncio
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from src.core.constants import MARKDOWN_SECTION_SEPARATOR, MARKDOWN_PAGE_HEADER_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+# SIMD base64 encoder (AVX2/AVX-512 when available, ~5-10x stdlib); falls back to stdlib
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:  # pragma: no cover - pybase64 is in requirements.txt
+    _b64encode = base64.b64encode
+
+# Read size when encoding PDFs; a multiple of 3 so chunks encode without padding
+BASE64_CHUNK_SIZE = 57 * 1024
+
+def filter_outlines_by_query_iter(outline_info: Iterable[dict], query: str) -> Iterator[dict]:
+    """
+    Yield outline sections whose title contains the query (case-insensitive).
+
+    Unlike filter_outlines_by_query there is no fallback: nothing is yielded
+    when no title matches, so callers can stop at the first hit with any()/next().
+
+    Args:
+        outline_info: Outline metadata dicts
+        query: Search query string
+
+    Yields:
+        Matching outline metadata dicts, in order
+    """
+    query_key = query.casefold()
+    for outline in outline_info:
+        if query_key in outline['title'].casefold():
+            yield outline
+
+
 def filter_outlines_by_query(outline_info: list, query: str) -> list:
     """
     Filter outline sections by query string (case-insensitive partial match).
@@ -22,11 +51,7 @@ def filter_outlines_by_query(outline_info: list, query: str) -> list:
     if not outline_info or not query:
         return outline_info
 
-    query_lower = query.lower()
-    filtered = [
-        outline for outline in outline_info
-        if query_lower in outline['title'].lower()
-    ]
+    filtered = list(filter_outlines_by_query_iter(outline_info, query))
 
     # If no matches found, return all outlines (fallback)
     return filtered if filtered else outline_info
@@ -44,7 +69,7 @@ def _encode_single_chunk(chunk_path: str) -> Tuple[str, str]:
     """
     with open(chunk_path, 'rb') as f:
         pdf_bytes = f.read()
-        pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+        pdf_base64 = _b64encode(pdf_bytes).decode('utf-8')
     return (chunk_path, pdf_base64)
 
 
@@ -96,19 +121,46 @@ def encode_pdf_to_base64(pdf_path: str) -> str:
     - azure_di/client.py
     - azure_document_intelligence_client.py
 
+    Reads and encodes BASE64_CHUNK_SIZE bytes at a time, so the raw PDF is
+    never fully in memory alongside its encoding.
+
     Args:
         pdf_path: Path to PDF file
 
     Returns:
         Base64-encoded string
     """
-    with open(pdf_path, 'rb') as pdf_file:
-        pdf_bytes = pdf_file.read()
-        pdf_base64 = base64.b64encode(pdf_bytes).decode('utf-8')
+    encoded = bytearray()
+    with open(pdf_path, 'rb', buffering=1 << 20) as pdf_file:
+        while chunk := pdf_file.read(BASE64_CHUNK_SIZE):
+            encoded += _b64encode(chunk)
+    pdf_base64 = encoded.decode('ascii')
     logger.debug(f"Encoded PDF to base64 ({len(pdf_base64)} chars)")
     return pdf_base64
 
 
+def extract_page_range_tables(pdf_path: str, start: int, end: int) -> List[list]:
+    """
+    Extract raw tables for pages [start, end) with pdfplumber.
+
+    Runs in text extraction pool workers: it opens its own handle and returns
+    plain lists. It lives here rather than under src.services so a spawned worker
+    doesn't import the services package (and every client SDK) on startup.
+
+    Args:
+        pdf_path: Path to PDF file
+        start: First page index (0-based, inclusive)
+        end: Last page index (0-based, exclusive)
+
+    Returns:
+        One list of tables per page, in page order
+    """
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path, pages=list(range(start + 1, end + 1))) as pdf:
+        return [page.extract_tables() for page in pdf.pages]
+
+
 def combine_markdown_sections(
     sections: List[str],
     separator: str = MARKDOWN_SECTION_SEPARATOR,
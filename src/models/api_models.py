@@ -5,6 +5,10 @@ from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import base64
+import re
+
+# Valid base64: A-Z, a-z, 0-9, +, / and up to two '=' of padding at the end
+_BASE64_PATTERN = re.compile(r'[A-Za-z0-9+/]*={0,2}')
 
 
 class Base64FileRequest(BaseModel):
@@ -52,15 +56,14 @@ class Base64FileRequest(BaseModel):
         Validate that file_content is valid base64 format.
 
         Performance optimized: Only validates format without decoding entire payload.
-        This saves 100-300ms for large PDFs during request validation.
+        The pattern is compiled once at import, and the decode itself happens once,
+        in PDFInputHandler.
         """
         if not v:
             raise ValueError("file_content cannot be empty")
 
         # Check if string contains only valid base64 characters
-        # Valid base64: A-Z, a-z, 0-9, +, /, = (padding)
-        import re
-        if not re.match(r'^[A-Za-z0-9+/]*={0,2}$', v):
+        if not _BASE64_PATTERN.fullmatch(v):
             raise ValueError("file_content must be valid base64-encoded string")
 
         # Basic length check: base64 length must be multiple of 4
@@ -65,10 +65,7 @@ class AzureDocumentIntelligenceClient:
 
     async def __aenter__(self):
         """Async context manager entry - initialize shared client."""
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
-        )
+        self._get_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -82,9 +79,17 @@ class AzureDocumentIntelligenceClient:
             self._client = None
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client instance."""
+        """Get the shared HTTP client, creating it on first use.
+
+        The client is kept for the lifetime of this instance so keep-alive
+        connections (and their TLS sessions) are reused across calls.
+        Call close() (or use the instance as an async context manager) to release it.
+        """
         if self._client is None:
-            return httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+            )
         return self._client
 
     async def extract_tables(
@@ -183,32 +188,26 @@ class AzureDocumentIntelligenceClient:
         }
 
         client = self._get_client()
-        should_close_client = self._client is None
 
-        try:
-            response = await client.post(
-                analyze_url,
-                headers=self.headers,
-                json=request_body
-            )
+        response = await client.post(
+            analyze_url,
+            headers=self.headers,
+            json=request_body
+        )
 
-            if response.status_code == 202:
-                # Success - get operation location from header
-                operation_location = response.headers.get("Operation-Location")
-                if not operation_location:
-                    raise ValueError("No Operation-Location header in response")
+        if response.status_code == 202:
+            # Success - get operation location from header
+            operation_location = response.headers.get("Operation-Location")
+            if not operation_location:
+                raise ValueError("No Operation-Location header in response")
 
-                logger.info(f"Analysis started, operation ID: {operation_location.split('/')[-1][:8]}...")
-                return operation_location
+            logger.info(f"Analysis started, operation ID: {operation_location.split('/')[-1][:8]}...")
+            return operation_location
 
-            else:
-                error_msg = f"Failed to start analysis ({response.status_code}): {response.text}"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
-
-        finally:
-            if should_close_client and client:
-                await client.aclose()
+        else:
+            error_msg = f"Failed to start analysis ({response.status_code}): {response.text}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
 
     async def _poll_analyze_result(
         self,
@@ -231,43 +230,37 @@ class AzureDocumentIntelligenceClient:
             ValueError: If operation fails or times out
         """
         client = self._get_client()
-        should_close_client = self._client is None
-
-        try:
-            for attempt in range(max_retries):
-                response = await client.get(
-                    operation_location,
-                    headers={"Ocp-Apim-Subscription-Key": self.api_key}
-                )
 
-                if response.status_code != 200:
-                    raise ValueError(f"Polling failed ({response.status_code}): {response.text}")
+        for attempt in range(max_retries):
+            response = await client.get(
+                operation_location,
+                headers={"Ocp-Apim-Subscription-Key": self.api_key}
+            )
 
-                result = response.json()
-                status = result.get("status")
+            if response.status_code != 200:
+                raise ValueError(f"Polling failed ({response.status_code}): {response.text}")
 
-                if status == "succeeded":
-                    logger.info(f"Analysis completed after {attempt + 1} polls")
-                    # Parse response
-                    doc_response = DocumentIntelligenceResponse.model_validate(result)
-                    return doc_response.analyze_result
+            result = response.json()
+            status = result.get("status")
 
-                elif status == "failed":
-                    error = result.get("error", {})
-                    raise ValueError(f"Analysis failed: {error}")
+            if status == "succeeded":
+                logger.info(f"Analysis completed after {attempt + 1} polls")
+                # Parse response
+                doc_response = DocumentIntelligenceResponse.model_validate(result)
+                return doc_response.analyze_result
 
-                elif status in ["running", "notStarted"]:
-                    logger.debug(f"Analysis in progress... (attempt {attempt + 1}/{max_retries})")
-                    await asyncio.sleep(poll_interval)
+            elif status == "failed":
+                error = result.get("error", {})
+                raise ValueError(f"Analysis failed: {error}")
 
-                else:
-                    raise ValueError(f"Unknown status: {status}")
+            elif status in ["running", "notStarted"]:
+                logger.debug(f"Analysis in progress... (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(poll_interval)
 
-            raise ValueError(f"Analysis timed out after {max_retries * poll_interval} seconds")
+            else:
+                raise ValueError(f"Unknown status: {status}")
 
-        finally:
-            if should_close_client and client:
-                await client.aclose()
+        raise ValueError(f"Analysis timed out after {max_retries * poll_interval} seconds")
 
     async def health_check(self) -> bool:
         """
@@ -277,22 +270,16 @@ class AzureDocumentIntelligenceClient:
             True if API is accessible, False otherwise
         """
         try:
-            # Simple health check - try to access the endpoint
-            client = httpx.AsyncClient(timeout=10.0) if self._client is None else self._client
-            should_close = self._client is None
-
-            try:
-                # Document Intelligence doesn't have a dedicated health endpoint
-                # We'll just verify the endpoint is reachable
-                info_url = f"{self.endpoint}/documentintelligence/info?api-version=2024-11-30"
-                response = await client.get(
-                    info_url,
-                    headers={"Ocp-Apim-Subscription-Key": self.api_key}
-                )
-                return response.status_code in [200, 404]  # 404 is ok, means endpoint is reachable
-            finally:
-                if should_close:
-                    await client.aclose()
+            # Document Intelligence doesn't have a dedicated health endpoint
+            # We'll just verify the endpoint is reachable
+            client = self._get_client()
+            info_url = f"{self.endpoint}/documentintelligence/info?api-version=2024-11-30"
+            response = await client.get(
+                info_url,
+                headers={"Ocp-Apim-Subscription-Key": self.api_key},
+                timeout=10.0
+            )
+            return response.status_code in [200, 404]  # 404 is ok, means endpoint is reachable
 
         except Exception as e:
             logger.warning(f"Health check failed: {e}")
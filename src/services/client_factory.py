@@ -117,6 +117,18 @@ class ClientFactory:
 
         return workflow_map[workflow]
 
+    async def close(self) -> None:
+        """Close the HTTP clients held by the clients created so far (app shutdown)."""
+        if self._mistral_client is not None:
+            await self._mistral_client.close()
+        if self._azure_di_client is not None:
+            await self._azure_di_client.close()
+        if self._openai_client is not None:
+            self._openai_client.client.close()
+        if self._gemini_client is not None:
+            self._gemini_client.client.close()
+        logger.info("Client factory clients closed")
+
 
 # Global singleton instance
 _client_factory: Optional[ClientFactory] = None
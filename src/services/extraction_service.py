@@ -1,26 +1,96 @@
+import os
 import logging
 import asyncio
-from typing import Optional
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
 from fastapi import HTTPException
 
 import fitz  # PyMuPDF
+from pypdf import PdfReader
 
 from src.core.config import settings
 from src.core.constants import MARKDOWN_SECTION_SEPARATOR
-from src.core.utils import encode_chunks_to_base64_async, combine_markdown_sections, format_page_header
+from src.core.process_pool import get_process_pool, discard_process_pool
+from src.core.utils import (
+    encode_chunks_to_base64_async,
+    combine_markdown_sections,
+    extract_page_range_tables,
+    format_page_header
+)
 from src.services.client_factory import get_client_factory
+from src.services.pdf_processor import PDFProcessor
+from src.services.mistral_client import MistralDocumentClient
+from src.services.openai_client import OpenAIDocumentClient
+from src.services.gemini_client import GeminiDocumentClient
+from src.services.azure_di import AzureDocumentIntelligenceClient
 
 logger = logging.getLogger(__name__)
 
-# Initialize client factory (lazy initialization of clients)
-client_factory = get_client_factory()
 
-# Convenience aliases for commonly used clients
-pdf_processor = client_factory.pdf_processor
-mistral_client = client_factory.mistral_client
-openai_client = client_factory.openai_client
-gemini_client = client_factory.gemini_client
-azure_document_intelligence_client = client_factory.azure_document_intelligence_client
+# Client accessors: clients are built by the factory when a request first needs
+# them, so importing this module (and the workflow handlers) constructs none.
+
+def get_pdf_processor() -> PDFProcessor:
+    """Get the shared PDF processor."""
+    return get_client_factory().pdf_processor
+
+
+def get_mistral_client() -> MistralDocumentClient:
+    """Get the shared Mistral client."""
+    return get_client_factory().mistral_client
+
+
+def get_openai_client() -> Optional[OpenAIDocumentClient]:
+    """Get the shared OpenAI client (None if not configured)."""
+    return get_client_factory().openai_client
+
+
+def get_gemini_client() -> Optional[GeminiDocumentClient]:
+    """Get the shared Gemini client (None if not configured)."""
+    return get_client_factory().gemini_client
+
+
+def get_azure_document_intelligence_client() -> Optional[AzureDocumentIntelligenceClient]:
+    """Get the shared Azure Document Intelligence client (None if not configured)."""
+    return get_client_factory().azure_document_intelligence_client
+
+
+# Name of the shared process pool for page-parallel pdfplumber extraction
+_TEXT_EXTRACTION_POOL = "text_extraction"
+
+
+def _extract_tables_by_page(pdf_path: str) -> List[list]:
+    """
+    Extract raw tables for every page, fanning page ranges out to worker processes.
+
+    pdfplumber is pure Python, so threads would serialize on the GIL; each worker
+    parses a contiguous page range instead. Small documents are parsed in-process
+    because pool dispatch would dominate. The page count comes from pypdf, which
+    reads it from the page tree without parsing any page.
+
+    Returns:
+        One list of tables per page, in page order
+    """
+    page_count = len(PdfReader(pdf_path).pages)
+    max_workers = min(settings.TEXT_EXTRACTION_WORKERS, os.cpu_count() or 1)
+    workers = min(max_workers, page_count)
+    if page_count < settings.TEXT_EXTRACTION_PARALLEL_MIN_PAGES or workers <= 1:
+        return extract_page_range_tables(pdf_path, 0, page_count)
+
+    bounds = [page_count * i // workers for i in range(workers + 1)]
+    try:
+        pool = get_process_pool(_TEXT_EXTRACTION_POOL, max_workers)
+        futures = [
+            pool.submit(extract_page_range_tables, pdf_path, bounds[i], bounds[i + 1])
+            for i in range(workers)
+        ]
+        # Ranges are contiguous and collected in submission order, so page order is preserved
+        return [page_tables for future in futures for page_tables in future.result()]
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"pdfplumber process pool unavailable ({e}), extracting sequentially")
+        # A broken pool rejects every later submit; start a fresh one next time
+        discard_process_pool(_TEXT_EXTRACTION_POOL)
+        return extract_page_range_tables(pdf_path, 0, page_count)
 
 
 def extract_text_from_pdf(pdf_path: str) -> tuple[str, dict]:
@@ -43,7 +113,6 @@ def extract_text_from_pdf(pdf_path: str) -> tuple[str, dict]:
     logger.info(f"Extracting tables from PDF using pdfplumber: {pdf_path}")
 
     try:
-        import pdfplumber
         import pandas as pd
         from bidi import get_display
         
@@ -61,34 +130,30 @@ def extract_text_from_pdf(pdf_path: str) -> tuple[str, dict]:
         
         tables_found = 0
         
-        with pdfplumber.open(pdf_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                # Extract tables from page
-                page_tables = page.extract_tables()
+        for i, page_tables in enumerate(_extract_tables_by_page(pdf_path)):
+            if page_tables:
+                tables_found += len(page_tables)
+                logger.info(f"Found {len(page_tables)} tables on page {i+1}")
                 
-                if page_tables:
-                    tables_found += len(page_tables)
-                    logger.info(f"Found {len(page_tables)} tables on page {i+1}")
+                for j, table_data in enumerate(page_tables):
+                    # Convert to DataFrame
+                    # Assume first row is header if it looks like one, otherwise treat as data
+                    # For "as is" extraction, we'll just treat all as data or use first row as header
+                    if len(table_data) > 1:
+                        df = pd.DataFrame(table_data[1:], columns=table_data[0])
+                    else:
+                        df = pd.DataFrame(table_data)
                     
-                    for j, table_data in enumerate(page_tables):
-                        # Convert to DataFrame
-                        # Assume first row is header if it looks like one, otherwise treat as data
-                        # For "as is" extraction, we'll just treat all as data or use first row as header
-                        if len(table_data) > 1:
-                            df = pd.DataFrame(table_data[1:], columns=table_data[0])
-                        else:
-                            df = pd.DataFrame(table_data)
-                        
-                        # Apply bidirectional text correction to all cells (and headers)
-                        df = df.map(fix_bidi_text)
-                        df.columns = [fix_bidi_text(col) if isinstance(col, str) else col for col in df.columns]
-                        
-                        # Convert to markdown "as is"
-                        markdown_table = df.to_markdown(index=False)
-
-                        markdown_parts.append(f"### Table {j+1} (Page {i+1})\n\n")
-                        markdown_parts.append(markdown_table)
-                        markdown_parts.append(MARKDOWN_SECTION_SEPARATOR)
+                    # Apply bidirectional text correction to all cells (and headers)
+                    df = df.map(fix_bidi_text)
+                    df.columns = [fix_bidi_text(col) if isinstance(col, str) else col for col in df.columns]
+                    
+                    # Convert to markdown "as is"
+                    markdown_table = df.to_markdown(index=False)
+
+                    markdown_parts.append(f"### Table {j+1} (Page {i+1})\n\n")
+                    markdown_parts.append(markdown_table)
+                    markdown_parts.append(MARKDOWN_SECTION_SEPARATOR)
 
         if tables_found == 0:
             logger.warning("pdfplumber found no tables in the document")
@@ -175,6 +240,7 @@ async def process_azure_document_intelligence(
     """
     logger.info(f"Processing PDF with Azure Document Intelligence for query: {query}")
 
+    azure_document_intelligence_client = get_azure_document_intelligence_client()
     if azure_document_intelligence_client is None:
         raise HTTPException(
             status_code=500,
@@ -245,7 +311,7 @@ async def process_with_model(
     if model_name == "mistral":
         # Use Mistral's batch document processing API
         # If validation is enabled and validation_model is specified, use that model
-        return await mistral_client.process_document(
+        return await get_mistral_client().process_document(
             pdf_path=chunk_path,
             pdf_base64=chunk_base64,
             pdf_bytes=chunk_bytes,
@@ -256,12 +322,13 @@ async def process_with_model(
 
     else:
         # For OpenAI/Gemini, process page-by-page
-        client_map = {
-            "openai": openai_client,
-            "gemini": gemini_client
+        client_getters = {
+            "openai": get_openai_client,
+            "gemini": get_gemini_client
         }
 
-        client = client_map.get(model_name)
+        get_client = client_getters.get(model_name)
+        client = get_client() if get_client else None
         if not client:
             raise HTTPException(
                 status_code=400,
@@ -395,6 +462,8 @@ async def process_ocr_with_images(
     """
     logger.info(f"Processing PDF with OCR with Images workflow for query: {query}")
 
+    pdf_processor = get_pdf_processor()
+    mistral_client = get_mistral_client()
     pdf_chunks = []
     try:
         # 1. Split PDF into chunks (respects MAX_PAGES_PER_CHUNK to stay under Mistral's 30-page limit)
@@ -451,6 +520,7 @@ async def process_ocr_with_images(
         prompt = query if query else settings.OCR_WITH_IMAGES_DEFAULT_PROMPT
 
         # Process each image with OpenAI
+        openai_client = get_openai_client()
         image_extractions = []
 
         for i, img in enumerate(all_images):
@@ -518,6 +588,7 @@ async def process_gemini_wf(
     """
     logger.info(f"Processing PDF with Gemini page-by-page workflow for query: {query}")
 
+    gemini_client = get_gemini_client()
     if gemini_client is None:
         raise HTTPException(
             status_code=500,
@@ -93,7 +93,8 @@ class GeminiDocumentClient:
         pdf_bytes: bytes,
         page_number: int,
         custom_system_prompt: Optional[str] = None,
-        custom_user_prompt_template: Optional[str] = None
+        custom_user_prompt_template: Optional[str] = None,
+        single_page: bool = False
     ) -> str:
         """
         Extract markdown content from a single PDF page using Gemini.
@@ -103,6 +104,8 @@ class GeminiDocumentClient:
             page_number: Page number (0-based) to extract
             custom_system_prompt: Optional custom system prompt (overrides settings)
             custom_user_prompt_template: Optional custom user prompt template (overrides settings)
+            single_page: If True, pdf_bytes already contains only this page (page_number
+                is then used for prompts and logging only)
 
         Returns:
             Extracted markdown content
@@ -113,10 +116,13 @@ class GeminiDocumentClient:
         try:
             logger.info(f"Extracting page {page_number} with Gemini")
 
-            # Extract single page as PDF
-            logger.debug(f"Extracting page {page_number} from PDF...")
-            page_pdf_bytes = self._extract_single_page_pdf(pdf_bytes, page_number)
-            logger.debug(f"Page extracted ({len(page_pdf_bytes)} bytes)")
+            # Extract single page as PDF (skip re-parsing if the caller already isolated it)
+            if single_page:
+                page_pdf_bytes = pdf_bytes
+            else:
+                logger.debug(f"Extracting page {page_number} from PDF...")
+                page_pdf_bytes = self._extract_single_page_pdf(pdf_bytes, page_number)
+                logger.debug(f"Page extracted ({len(page_pdf_bytes)} bytes)")
 
             # Use custom prompts if provided, otherwise use settings
             system_instruction = custom_system_prompt or settings.get_system_prompt("gemini")
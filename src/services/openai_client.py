@@ -135,7 +135,8 @@ class OpenAIDocumentClient:
         pdf_bytes: bytes,
         page_number: int,
         custom_system_prompt: Optional[str] = None,
-        custom_user_prompt_template: Optional[str] = None
+        custom_user_prompt_template: Optional[str] = None,
+        single_page: bool = False
     ) -> str:
         """
         Extract markdown content from a single PDF page using Azure OpenAI.
@@ -145,6 +146,8 @@ class OpenAIDocumentClient:
             page_number: Page number (0-based) to extract
             custom_system_prompt: Optional custom system prompt (overrides settings)
             custom_user_prompt_template: Optional custom user prompt template (overrides settings)
+            single_page: If True, pdf_bytes already contains only this page (page_number
+                is then used for prompts and logging only)
 
         Returns:
             Extracted markdown content
@@ -157,7 +160,7 @@ class OpenAIDocumentClient:
 
             # Convert PDF page to base64 images
             logger.debug(f"Converting page {page_number} to image...")
-            base64_images = self._pdf_page_to_images(pdf_bytes, page_number)
+            base64_images = self._pdf_page_to_images(pdf_bytes, 0 if single_page else page_number)
             logger.debug(f"Page converted to {len(base64_images)} image(s)")
 
             # Determine which API to use
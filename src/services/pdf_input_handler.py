@@ -85,7 +85,8 @@ class PDFInputHandler:
             if len(base64_content) > settings.MAX_BASE64_LENGTH:
                 raise PDFValidationError("Base64 payload too large")
 
-            pdf_bytes = base64.b64decode(base64_content)
+            # Strict decode: reject non-base64 characters instead of silently dropping them
+            pdf_bytes = base64.b64decode(base64_content, validate=True)
             self._enforce_size_limit(len(pdf_bytes))
 
             if not pdf_bytes.startswith(b"%PDF"):
@@ -1,15 +1,17 @@
 """
 PDF processing service for splitting PDFs by outlines and combining results.
 """
+import asyncio
 import logging
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import AsyncIterator, List, Dict, Tuple, Optional
 import tempfile
 
 import pypdf
 from pypdf import PdfReader, PdfWriter
 
 from src.core.config import settings
+from src.core.constants import MARKDOWN_SECTION_SEPARATOR
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +41,33 @@ class PDFProcessor:
             - outline_info: List of outline metadata dicts with 'title', 'page', 'chunk_indices'
                            None if no outlines found
         """
+        reader, page_ranges, outline_info = self.plan_split_with_outline_info(pdf_path)
+        if page_ranges is None:
+            return [pdf_path], None
+
+        chunks = [self._create_chunk(reader, start, end, name) for start, end, name in page_ranges]
+        return chunks, outline_info
+
+    def plan_split_with_outline_info(
+        self,
+        pdf_path: str
+    ) -> Tuple[PdfReader, Optional[List[Tuple[int, int, str]]], Optional[List[Dict]]]:
+        """
+        Plan the split_with_outline_info chunks without writing any chunk files.
+
+        Lets callers write chunks one at a time (see iter_chunks) and start working on
+        early chunks while later ones are still being written.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Tuple of (reader, page_ranges, outline_info)
+            - reader: PdfReader for the PDF (pass to iter_chunks)
+            - page_ranges: (start_page, end_page, name) per chunk, in chunk order;
+                           None if the PDF is within the size limit (use pdf_path as-is)
+            - outline_info: Same as split_with_outline_info
+        """
         reader = PdfReader(pdf_path)
         total_pages = len(reader.pages)
 
@@ -47,7 +76,7 @@ class PDFProcessor:
         # If PDF is within limit, return it as-is with no outline info
         if total_pages <= self.max_pages_per_chunk:
             logger.info("PDF within size limit, no splitting needed")
-            return [pdf_path], None
+            return reader, None, None
 
         # Try to get main outlines (top-level only) - limit to max 4
         outlines = self._get_main_outlines(reader)
@@ -60,12 +89,30 @@ class PDFProcessor:
             else:
                 logger.info(f"Found {len(outlines)} main outline sections")
 
-            chunks, outline_metadata = self._split_by_outlines(reader, outlines, pdf_path, collect_metadata=True)
-            return chunks, outline_metadata
+            page_ranges, outline_metadata = self._plan_outline_ranges(outlines, total_pages)
+            return reader, page_ranges, outline_metadata
         else:
             logger.info("No outlines found, splitting by page count")
-            chunks = self._split_by_page_count(reader, pdf_path)
-            return chunks, None
+            return reader, self._plan_page_range(0, total_pages, "chunk"), None
+
+    async def iter_chunks(
+        self,
+        reader: PdfReader,
+        page_ranges: List[Tuple[int, int, str]]
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """
+        Write planned chunks one at a time, yielding each as soon as it is on disk.
+
+        Args:
+            reader: PdfReader returned by plan_split_with_outline_info
+            page_ranges: Page ranges returned by plan_split_with_outline_info
+
+        Yields:
+            Tuple of (chunk_index, chunk_path)
+        """
+        for chunk_index, (start_page, end_page, name) in enumerate(page_ranges):
+            chunk_path = await asyncio.to_thread(self._create_chunk, reader, start_page, end_page, name)
+            yield chunk_index, chunk_path
 
     def split_by_main_outlines(self, pdf_path: str) -> List[str]:
         """
@@ -167,9 +214,35 @@ class PDFProcessor:
             This function unifies the previously duplicate _split_by_outlines and
             _split_by_outlines_with_metadata methods, eliminating 120 lines of duplication.
         """
-        chunks = []
-        outline_metadata = [] if collect_metadata else None
-        total_pages = len(reader.pages)
+        page_ranges, outline_metadata = self._plan_outline_ranges(outlines, len(reader.pages))
+        chunks = [self._create_chunk(reader, start, end, name) for start, end, name in page_ranges]
+
+        # Return tuple or list depending on collect_metadata flag
+        if collect_metadata:
+            return chunks, outline_metadata
+        return chunks
+
+    def _plan_outline_ranges(
+        self,
+        outlines: List[dict],
+        total_pages: int
+    ) -> Tuple[List[Tuple[int, int, str]], List[Dict]]:
+        """
+        Compute chunk page ranges for outline sections.
+
+        Sections exceeding max pages are split into several ranges.
+
+        Args:
+            outlines: List of outline dictionaries
+            total_pages: Total number of pages in the PDF
+
+        Returns:
+            Tuple of (page_ranges, outline_metadata)
+            - page_ranges: (start_page, end_page, name) per chunk
+            - outline_metadata: Dicts with 'title', 'page', 'chunk_indices'
+        """
+        page_ranges = []
+        outline_metadata = []
 
         for i, outline in enumerate(outlines):
             start_page = outline['page']
@@ -181,44 +254,26 @@ class PDFProcessor:
                 end_page = total_pages
 
             section_pages = end_page - start_page
-            chunk_start_idx = len(chunks) if collect_metadata else None
+            chunk_start_idx = len(page_ranges)
 
             # If section is within limit, create single chunk
             if section_pages <= self.max_pages_per_chunk:
-                chunk_path = self._create_chunk(
-                    reader,
-                    start_page,
-                    end_page,
-                    f"section_{i}"
-                )
-                chunks.append(chunk_path)
+                page_ranges.append((start_page, end_page, f"section_{i}"))
             else:
                 # Split large section into smaller chunks
                 logger.info(
                     f"Section '{outline['title']}' has {section_pages} pages, "
                     f"splitting further"
                 )
-                sub_chunks = self._split_page_range(
-                    reader,
-                    start_page,
-                    end_page,
-                    f"section_{i}"
-                )
-                chunks.extend(sub_chunks)
+                page_ranges.extend(self._plan_page_range(start_page, end_page, f"section_{i}"))
 
-            # Store outline metadata if requested
-            if collect_metadata:
-                chunk_end_idx = len(chunks)
-                outline_metadata.append({
-                    'title': outline['title'],
-                    'page': start_page,
-                    'chunk_indices': list(range(chunk_start_idx, chunk_end_idx))
-                })
+            outline_metadata.append({
+                'title': outline['title'],
+                'page': start_page,
+                'chunk_indices': list(range(chunk_start_idx, len(page_ranges)))
+            })
 
-        # Return tuple or list depending on collect_metadata flag
-        if collect_metadata:
-            return chunks, outline_metadata
-        return chunks
+        return page_ranges, outline_metadata
 
     def _split_by_page_count(self, reader: PdfReader, original_path: str) -> List[str]:
         """
@@ -253,25 +308,35 @@ class PDFProcessor:
         Returns:
             List of temporary PDF chunk file paths
         """
-        chunks = []
+        return [
+            self._create_chunk(reader, chunk_start, chunk_end, name)
+            for chunk_start, chunk_end, name in self._plan_page_range(start_page, end_page, prefix)
+        ]
+
+    def _plan_page_range(self, start_page: int, end_page: int, prefix: str) -> List[Tuple[int, int, str]]:
+        """
+        Compute chunk page ranges of at most max_pages_per_chunk for a page range.
+
+        Args:
+            start_page: Starting page index
+            end_page: Ending page index (exclusive)
+            prefix: Prefix for chunk filenames
+
+        Returns:
+            List of (start_page, end_page, name) tuples
+        """
+        page_ranges = []
         current_page = start_page
 
         chunk_idx = 0
         while current_page < end_page:
             chunk_end = min(current_page + self.max_pages_per_chunk, end_page)
-
-            chunk_path = self._create_chunk(
-                reader,
-                current_page,
-                chunk_end,
-                f"{prefix}_{chunk_idx}"
-            )
-            chunks.append(chunk_path)
+            page_ranges.append((current_page, chunk_end, f"{prefix}_{chunk_idx}"))
 
             current_page = chunk_end
             chunk_idx += 1
 
-        return chunks
+        return page_ranges
 
     def _create_chunk(
         self,
@@ -320,8 +385,6 @@ class PDFProcessor:
             chunk_paths: List of chunk file paths to delete
             original_path: Optional original PDF path to preserve
         """
-        import asyncio
-
         async def delete_file(chunk_path: str):
             """Helper to delete a single file asynchronously."""
             # Don't delete the original file if it was returned as-is
@@ -354,16 +417,8 @@ class PDFProcessor:
         if len(markdown_chunks) == 1:
             return markdown_chunks[0]
 
-        # Combine chunks with separators
-        combined = []
-        for i, chunk in enumerate(markdown_chunks):
-            if i > 0:
-                # Add a visual separator between chunks
-                combined.append("\n\n---\n\n")
-
-            combined.append(chunk.strip())
-
-        result = "".join(combined)
+        # Combine chunks with a visual separator (single pre-sized join)
+        result = MARKDOWN_SECTION_SEPARATOR.join(chunk.strip() for chunk in markdown_chunks)
         logger.info(f"Combined {len(markdown_chunks)} markdown chunks")
 
         return result
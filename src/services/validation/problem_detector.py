@@ -32,6 +32,31 @@ class ProblemDetector:
     # Matches 5+ consecutive lines with mostly empty cells: | | |
     PROBLEM_PATTERN = re.compile(r'(\|\s*\|\s*\|.*\n){5,}')
 
+    # Financial keywords (English and Hebrew) expected on substantial pages
+    FINANCIAL_KEYWORDS = (
+        # English
+        'revenue', 'expense', 'balance', 'asset', 'liability', 'equity',
+        'income', 'profit', 'loss', 'debit', 'credit', 'account',
+        'total', 'subtotal', 'amount', 'date', 'transaction', 'payment',
+        'statement', 'bank', 'financial', 'report', 'summary',
+        # Hebrew
+        'הכנסות', 'הוצאות', 'יתרה', 'חשבון', 'סכום',
+        'סה"כ', 'זכות', 'חובה', 'תאריך', 'עסקה',
+        'תשלום', 'דוח', 'כספי', 'מאזן', 'רווח', 'הפסד'
+    )
+
+    # Literal checks are folded into single compiled patterns so each page is
+    # scanned once per check instead of once per literal
+    FINANCIAL_KEYWORDS_PATTERN = re.compile('|'.join(map(re.escape, FINANCIAL_KEYWORDS)))
+    UNKNOWN_CHARS_PATTERN = re.compile(r'[□�☐▯▢▣]|\s\?\s')
+
+    # Remaining detection patterns, compiled once at class definition
+    DIGITS_PATTERN = re.compile(r'\d+')
+    REPEATED_CHAR_PATTERN = re.compile(r'(.)\1{9,}')
+    REPEATED_TABLE_NUMBER_PATTERN = re.compile(r'\|\s*(\d+(?:[.,]\d+)?)\s*\|(?:\s*\1\s*\|){2,}')
+    REPEATED_TEXT_NUMBER_PATTERN = re.compile(r'\b(\d+(?:[.,]\d+)?)\s+(?:\1\s+){2,}')
+    MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(([^\)]+)\)')
+
     def __init__(self, number_extractor=None):
         """
         Initialize problem detector.
@@ -98,7 +123,7 @@ class ProblemDetector:
             numbers = self._extract_numbers(markdown_content)
         else:
             # Fallback: simple digit check
-            numbers = re.findall(r'\d+', markdown_content)
+            numbers = self.DIGITS_PATTERN.findall(markdown_content)
 
         if table_rows >= 5 and len(numbers) == 0:
             logger.debug(f"Missing numbers: table with ~{table_rows:.0f} rows but 0 numbers")
@@ -143,8 +168,7 @@ class ProblemDetector:
             return False
 
         # Pattern: same character repeated 10+ times
-        pattern = r'(.)\1{9,}'
-        matches = re.findall(pattern, markdown_content)
+        matches = self.REPEATED_CHAR_PATTERN.findall(markdown_content)
 
         # Filter out intentional repeated characters (spaces, dashes, underscores)
         problematic_matches = [m for m in matches if m not in [' ', '-', '_', '=', '*', '\n']]
@@ -236,21 +260,8 @@ class ProblemDetector:
         if not markdown_content or len(markdown_content) < 500:
             return False  # Only check substantial pages
 
-        # Financial keywords (English and Hebrew)
-        financial_keywords = [
-            # English
-            'revenue', 'expense', 'balance', 'asset', 'liability', 'equity',
-            'income', 'profit', 'loss', 'debit', 'credit', 'account',
-            'total', 'subtotal', 'amount', 'date', 'transaction', 'payment',
-            'statement', 'bank', 'financial', 'report', 'summary',
-            # Hebrew
-            'הכנסות', 'הוצאות', 'יתרה', 'חשבון', 'סכום',
-            'סה"כ', 'זכות', 'חובה', 'תאריך', 'עסקה',
-            'תשלום', 'דוח', 'כספי', 'מאזן', 'רווח', 'הפסד'
-        ]
-
         content_lower = markdown_content.lower()
-        has_keyword = any(keyword in content_lower for keyword in financial_keywords)
+        has_keyword = self.FINANCIAL_KEYWORDS_PATTERN.search(content_lower) is not None
 
         if not has_keyword:
             logger.debug("Missing keywords: no financial terms found in substantial page")
@@ -336,8 +347,7 @@ class ProblemDetector:
 
         # Pattern 1: Number repeated in table cells (with pipes)
         # Matches: | 1000 | 1000 | 1000 |
-        table_pattern = r'\|\s*(\d+(?:[.,]\d+)?)\s*\|(?:\s*\1\s*\|){2,}'
-        table_matches = re.findall(table_pattern, markdown_content)
+        table_matches = self.REPEATED_TABLE_NUMBER_PATTERN.findall(markdown_content)
 
         if table_matches:
             logger.debug(f"Repetitive numbers in table: {len(table_matches)} instances")
@@ -345,8 +355,7 @@ class ProblemDetector:
 
         # Pattern 2: Number repeated in plain text (space-separated)
         # Matches: 1000 1000 1000
-        text_pattern = r'\b(\d+(?:[.,]\d+)?)\s+(?:\1\s+){2,}'
-        text_matches = re.findall(text_pattern, markdown_content)
+        text_matches = self.REPEATED_TEXT_NUMBER_PATTERN.findall(markdown_content)
 
         if text_matches:
             logger.debug(f"Repetitive numbers in text: {len(text_matches)} instances")
@@ -363,15 +372,10 @@ class ProblemDetector:
         if not markdown_content:
             return False
 
-        # Unknown character indicators
-        unknown_chars = ['□', '�', '☐', '▯', '�', '▢', '▣']
-
+        # Unknown character indicators (□, �, ☐, ▯, ▢, ▣) and standalone question marks,
+        # counted in a single pass
         total_chars = len(markdown_content)
-        unknown_count = sum(markdown_content.count(char) for char in unknown_chars)
-
-        # Also count standalone question marks (not in words)
-        standalone_questions = len(re.findall(r'\s\?\s', markdown_content))
-        unknown_count += standalone_questions
+        unknown_count = len(self.UNKNOWN_CHARS_PATTERN.findall(markdown_content))
 
         if total_chars > 0 and (unknown_count / total_chars) > 0.05:
             logger.debug(f"Unknown characters: {unknown_count} ({unknown_count/total_chars:.1%})")
@@ -391,8 +395,7 @@ class ProblemDetector:
             return False
 
         # Regex: ![anything](anything)
-        image_pattern = r'!\[([^\]]*)\]\(([^\)]+)\)'
-        matches = re.findall(image_pattern, markdown_content)
+        matches = self.MARKDOWN_IMAGE_PATTERN.findall(markdown_content)
 
         if matches:
             logger.debug(f"Markdown images detected: {len(matches)} instances")
@@ -4,22 +4,80 @@ Validation orchestration for PDF content quality assurance.
 Coordinates problem detection, similarity calculation, and cross-validation.
 """
 import asyncio
+import hashlib
 import logging
+import os
 import time
-import random
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 
+import fitz  # PyMuPDF
+
 from src.core.config import settings
+from src.core.process_pool import get_process_pool, discard_process_pool
 from src.services.openai_client import OpenAIDocumentClient
 from src.models.mistral_models import MistralOCRResponse
 
 from .problem_detector import ProblemDetector
-from .similarity_calculator import SimilarityCalculator
-from .content_normalizer import ContentNormalizer
+from src.core.similarity_calculator import SimilarityCalculator, score_similarity
+from src.core.content_normalizer import ContentNormalizer
 
 logger = logging.getLogger(__name__)
 
+# Name of the shared process pool for CPU-bound similarity scoring
+_SIMILARITY_POOL = "similarity"
+
+
+# LRU cache of validator extractions keyed by page content, so retries and
+# re-processed documents don't pay for the same validator call twice.
+_extract_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+
+def _extract_cache_key(
+    page_pdf_bytes: bytes,
+    page_number: int,
+    custom_system_prompt: Optional[str],
+    custom_user_prompt_template: Optional[str],
+    single_page: bool
+) -> tuple:
+    """Build the extraction cache key from the page bytes digest and everything that shapes the prompt."""
+    return (
+        settings.VALIDATION_PROVIDER,
+        hashlib.blake2b(page_pdf_bytes, digest_size=16).digest(),
+        page_number,
+        single_page,
+        custom_system_prompt or "",
+        custom_user_prompt_template or "",
+    )
+
+
+def _document_id(pdf_bytes: bytes) -> int:
+    """Derive a stable 64-bit document id from the head of the PDF (used to offset sampling)."""
+    return int.from_bytes(hashlib.blake2b(pdf_bytes[:4096], digest_size=8).digest(), "big")
+
+
+def _extract_pdf_page(pdf_document: "fitz.Document", page_index: int) -> Optional[bytes]:
+    """
+    Slice one page out of an already-opened PDF into a standalone single-page PDF.
+
+    Args:
+        pdf_document: Open PyMuPDF document (parsed once per validation run)
+        page_index: Zero-based index of the page to extract
+
+    Returns:
+        Single-page PDF bytes, or None if the page is out of range
+    """
+    if page_index >= len(pdf_document):
+        return None
+    single_page_pdf = fitz.open()
+    try:
+        single_page_pdf.insert_pdf(pdf_document, from_page=page_index, to_page=page_index)
+        return single_page_pdf.tobytes()
+    finally:
+        single_page_pdf.close()
+
 
 @dataclass
 class ValidationResult:
@@ -158,16 +216,20 @@ class ValidationService:
         page_index: int,
         total_pages: int,
         has_query: bool,
-        random_offset: int
+        doc_id: int = 0
     ) -> bool:
         """
         Determine if a page should be sample-validated.
 
+        Sampling is a deterministic stride: every Nth page, offset by the document id,
+        so the same document always samples the same pages (reproducible runs and
+        stable validator cache hits) while different documents sample different pages.
+
         Args:
             page_index: Zero-based page index
             total_pages: Total number of pages
             has_query: Whether query filtering is active
-            random_offset: Random offset for sampling (0-9)
+            doc_id: Stable document id (see _document_id)
 
         Returns:
             True if page should be validated, False otherwise
@@ -177,7 +239,7 @@ class ValidationService:
 
         # Check if this page falls on the sample interval
         sample_rate = settings.VALIDATION_SAMPLE_RATE
-        return (page_index - random_offset) % sample_rate == 0
+        return (page_index - doc_id) % sample_rate == 0
 
     async def validate_page(
         self,
@@ -209,93 +271,330 @@ class ValidationService:
         try:
             # Use pre-detected problems or detect if not provided (avoid duplicate detection)
             if detected_problems is None:
-                has_problem, detected_problems = self.has_any_problem(original_content)
-            else:
-                has_problem = bool(detected_problems)
-
-            if has_problem:
-                logger.info(f"[Page {page_number}] Problems detected ({', '.join(detected_problems)}) - replacing with Gemini")
+                _, detected_problems = self.has_any_problem(original_content)
 
-            # Extract with validator (Gemini) - run in thread pool to avoid blocking
-            alternative_content = await asyncio.to_thread(
-                self.validator_client.extract_page_content,
+            alternative_content = await self._fetch_alternative(
                 page_pdf_bytes,
                 page_number,
+                detected_problems,
                 custom_system_prompt,
                 custom_user_prompt_template
             )
 
-            # If problems exist, just use Gemini directly (no comparison needed)
-            if has_problem:
-                similarity_score = 0.0  # Indicate replacement
-                passed = False  # Use alternative content
-                logger.info(f"[Page {page_number}] Using Gemini extraction directly (problems detected)")
-            else:
-                # Only calculate similarity if no problems (clean page sample validation)
-                # OPTIMIZATION: Run similarity calculation async to avoid blocking (can be CPU-intensive)
-                similarity_score = await asyncio.to_thread(
-                    self.calculate_similarity,
-                    original_content,
-                    alternative_content
-                )
-                passed = similarity_score >= settings.VALIDATION_SIMILARITY_THRESHOLD
-
-            processing_time = time.time() - start_time
-
-            # Get normalized versions for logging
-            norm1 = self.normalizer.normalize_for_comparison(original_content)
-            norm2 = self.normalizer.normalize_for_comparison(alternative_content)
-
-            # Log content comparison
-            # Determine validator name dynamically based on settings
-            validator_name = settings.VALIDATION_PROVIDER.upper()
-            logger.info(f"\n{'='*80}")
-            logger.info(f"[Page {page_number}] VALIDATION CONTENT COMPARISON ({validator_name})")
-            logger.info(f"{'='*80}")
-            logger.info(f"Mistral Content ({len(original_content)} chars, {len(norm1)} alphanumeric):")
-            logger.info(f"{'-'*80}")
-            logger.info(f"{original_content[:500]}{'...' if len(original_content) > 500 else ''}")
-            logger.info(f"{'-'*80}")
-            logger.info(f"Validator ({validator_name}) Content ({len(alternative_content)} chars, {len(norm2)} alphanumeric):")
-            logger.info(f"{'-'*80}")
-            logger.info(f"{alternative_content[:500]}{'...' if len(alternative_content) > 500 else ''}")
-            logger.info(f"{'-'*80}")
-            logger.info(f"Normalized Mistral (first 200 chars): {norm1[:200]}{'...' if len(norm1) > 200 else ''}")
-            logger.info(f"Normalized {validator_name} (first 200 chars): {norm2[:200]}{'...' if len(norm2) > 200 else ''}")
-            logger.info(f"{'-'*80}")
-
-            # Log result
-            status = "PASSED" if passed else "FAILED"
-            logger.info(
-                f"[Page {page_number}] Similarity: {similarity_score:.2%} - {status} "
-                f"(threshold: {settings.VALIDATION_SIMILARITY_THRESHOLD:.2%})"
-            )
-            logger.info(f"{'='*80}\n")
-
-            return ValidationResult(
-                page_number=page_number,
-                similarity_score=similarity_score,
-                passed=passed,
-                has_problem_pattern=has_problem,
-                alternative_content=alternative_content if (has_problem or not passed) else None,
-                processing_time=processing_time
+            return await self._score(
+                original_content,
+                alternative_content,
+                page_number,
+                detected_problems,
+                start_time
             )
 
         except Exception as e:
-            processing_time = time.time() - start_time
-            logger.error(f"[Page {page_number}] Validation failed with error: {e}")
-
-            has_problem, _ = self.has_any_problem(original_content)
-
-            return ValidationResult(
-                page_number=page_number,
-                similarity_score=0.0,
-                passed=False,
-                has_problem_pattern=has_problem,
-                alternative_content=None,
-                processing_time=processing_time,
-                error=str(e)
+            return self._error_result(original_content, page_number, start_time, e)
+
+    async def _fetch_alternative(
+        self,
+        page_pdf_bytes: bytes,
+        page_number: int,
+        detected_problems: List[str],
+        custom_system_prompt: Optional[str] = None,
+        custom_user_prompt_template: Optional[str] = None,
+        single_page: bool = False
+    ) -> str:
+        """
+        Fetch the validator's extraction for a single page (network-bound stage).
+
+        Args:
+            page_pdf_bytes: PDF bytes for this specific page
+            page_number: Page number (0-based)
+            detected_problems: Problems detected on the original content
+            custom_system_prompt: Optional custom system prompt
+            custom_user_prompt_template: Optional custom user prompt template
+            single_page: Whether page_pdf_bytes already holds only this page
+
+        Returns:
+            Markdown content extracted by the validator
+        """
+        if detected_problems:
+            logger.info(f"[Page {page_number}] Problems detected ({', '.join(detected_problems)}) - replacing with Gemini")
+
+        cache_size = settings.VALIDATION_CACHE_SIZE
+        cache_key = None
+        if cache_size > 0:
+            cache_key = _extract_cache_key(
+                page_pdf_bytes, page_number, custom_system_prompt, custom_user_prompt_template, single_page
+            )
+            cached = _extract_cache.get(cache_key)
+            if cached is not None:
+                _extract_cache.move_to_end(cache_key)
+                logger.info(f"[Page {page_number}] Using cached validator extraction")
+                return cached
+
+        # Extract with validator (Gemini) - run in thread pool to avoid blocking
+        alternative_content = await asyncio.to_thread(
+            self.validator_client.extract_page_content,
+            page_pdf_bytes,
+            page_number,
+            custom_system_prompt,
+            custom_user_prompt_template,
+            single_page
+        )
+
+        if cache_key is not None:
+            _extract_cache[cache_key] = alternative_content
+            while len(_extract_cache) > cache_size:
+                _extract_cache.popitem(last=False)
+
+        return alternative_content
+
+    async def _score(
+        self,
+        original_content: str,
+        alternative_content: str,
+        page_number: int,
+        detected_problems: List[str],
+        start_time: float
+    ) -> ValidationResult:
+        """
+        Score the validator's extraction against the original (CPU-bound stage).
+
+        Args:
+            original_content: Content from Mistral extraction
+            alternative_content: Content from the validator
+            page_number: Page number (0-based)
+            detected_problems: Problems detected on the original content
+            start_time: time.time() at which validation of this page started
+
+        Returns:
+            ValidationResult with comparison details
+        """
+        has_problem = bool(detected_problems)
+
+        # If problems exist, just use Gemini directly (no comparison needed)
+        if has_problem:
+            similarity_score = 0.0  # Indicate replacement
+            passed = False  # Use alternative content
+            logger.info(f"[Page {page_number}] Using Gemini extraction directly (problems detected)")
+        else:
+            # Only calculate similarity if no problems (clean page sample validation)
+            similarity_score = await self._calculate_similarity_async(original_content, alternative_content)
+            passed = similarity_score >= settings.VALIDATION_SIMILARITY_THRESHOLD
+
+        processing_time = time.time() - start_time
+
+        # Get normalized versions for logging
+        norm1 = self.normalizer.normalize_for_comparison(original_content)
+        norm2 = self.normalizer.normalize_for_comparison(alternative_content)
+
+        # Log content comparison
+        # Determine validator name dynamically based on settings
+        validator_name = settings.VALIDATION_PROVIDER.upper()
+        logger.info(f"\n{'='*80}")
+        logger.info(f"[Page {page_number}] VALIDATION CONTENT COMPARISON ({validator_name})")
+        logger.info(f"{'='*80}")
+        logger.info(f"Mistral Content ({len(original_content)} chars, {len(norm1)} alphanumeric):")
+        logger.info(f"{'-'*80}")
+        logger.info(f"{original_content[:500]}{'...' if len(original_content) > 500 else ''}")
+        logger.info(f"{'-'*80}")
+        logger.info(f"Validator ({validator_name}) Content ({len(alternative_content)} chars, {len(norm2)} alphanumeric):")
+        logger.info(f"{'-'*80}")
+        logger.info(f"{alternative_content[:500]}{'...' if len(alternative_content) > 500 else ''}")
+        logger.info(f"{'-'*80}")
+        logger.info(f"Normalized Mistral (first 200 chars): {norm1[:200]}{'...' if len(norm1) > 200 else ''}")
+        logger.info(f"Normalized {validator_name} (first 200 chars): {norm2[:200]}{'...' if len(norm2) > 200 else ''}")
+        logger.info(f"{'-'*80}")
+
+        # Log result
+        status = "PASSED" if passed else "FAILED"
+        logger.info(
+            f"[Page {page_number}] Similarity: {similarity_score:.2%} - {status} "
+            f"(threshold: {settings.VALIDATION_SIMILARITY_THRESHOLD:.2%})"
+        )
+        logger.info(f"{'='*80}\n")
+
+        return ValidationResult(
+            page_number=page_number,
+            similarity_score=similarity_score,
+            passed=passed,
+            has_problem_pattern=has_problem,
+            alternative_content=alternative_content if (has_problem or not passed) else None,
+            processing_time=processing_time
+        )
+
+    async def _calculate_similarity_async(self, content1: str, content2: str) -> float:
+        """
+        Calculate similarity off the event loop.
+
+        Normalization and number extraction are pure Python, so threads cannot score
+        pages in parallel under the GIL. Scoring runs in the shared process pool when
+        VALIDATION_SIMILARITY_USE_PROCESSES is enabled, falling back to a thread if
+        the pool is unavailable.
+
+        Args:
+            content1: First content string
+            content2: Second content string
+
+        Returns:
+            Similarity score between 0.0 and 1.0
+        """
+        if settings.VALIDATION_SIMILARITY_USE_PROCESSES:
+            try:
+                loop = asyncio.get_running_loop()
+                pool = get_process_pool(_SIMILARITY_POOL, os.cpu_count() or 1)
+                return await loop.run_in_executor(
+                    pool, score_similarity, content1, content2, settings.VALIDATION_SIMILARITY_METHOD
+                )
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Similarity process pool unavailable ({e}), falling back to thread")
+                # A broken pool rejects every later submit; start a fresh one next time
+                discard_process_pool(_SIMILARITY_POOL)
+
+        return await asyncio.to_thread(self.calculate_similarity, content1, content2)
+
+    def _error_result(
+        self,
+        original_content: str,
+        page_number: int,
+        start_time: float,
+        error: Exception
+    ) -> ValidationResult:
+        """Build the ValidationResult reported when validating a page fails."""
+        processing_time = time.time() - start_time
+        logger.error(f"[Page {page_number}] Validation failed with error: {error}")
+
+        has_problem, _ = self.has_any_problem(original_content)
+
+        return ValidationResult(
+            page_number=page_number,
+            similarity_score=0.0,
+            passed=False,
+            has_problem_pattern=has_problem,
+            alternative_content=None,
+            processing_time=processing_time,
+            error=str(error)
+        )
+
+    async def _run_validation_pipeline(
+        self,
+        fetch_queue: asyncio.Queue,
+        pdf_bytes: bytes
+    ) -> List[ValidationResult]:
+        """
+        Validate queued pages with overlapping network and CPU stages.
+
+        A fixed pool of fetch workers calls the validator while a pool of scoring
+        workers computes similarity for pages whose validator output has already
+        arrived, so similarity on page N runs while the request for page N+1 is
+        still in flight. Wall time approaches max(network, cpu) instead of the sum.
+
+        Pages are consumed as the producer queues them, so validation starts before
+        problem detection has finished for the whole document. The producer puts a
+        single None once it is done queueing.
+
+        Args:
+            fetch_queue: Queue of (page_index, page_content, reason, detected_problems,
+                custom_system, custom_user) tuples, terminated by None
+            pdf_bytes: PDF file bytes
+
+        Returns:
+            ValidationResults ordered by page number
+        """
+        score_queue: asyncio.Queue = asyncio.Queue()
+        results: List[ValidationResult] = []
+
+        fetch_worker_count = max(1, settings.VALIDATION_FETCH_WORKERS)
+        score_worker_count = max(1, os.cpu_count() or 1)
+
+        # Parse the PDF once (on first use) and hand each validator call only its own page.
+        # PyMuPDF documents are not thread-safe, so slicing is serialized.
+        pdf_document = None
+        slicing_failed = False
+        slice_lock = asyncio.Lock()
+
+        async def get_page_bytes(page_index: int) -> Optional[bytes]:
+            nonlocal pdf_document, slicing_failed
+            async with slice_lock:
+                if slicing_failed:
+                    return None
+                try:
+                    if pdf_document is None:
+                        pdf_document = await asyncio.to_thread(fitz.open, stream=pdf_bytes, filetype="pdf")
+                    return await asyncio.to_thread(_extract_pdf_page, pdf_document, page_index)
+                except Exception as e:
+                    logger.warning(f"Failed to split PDF pages ({e}), validators will receive the full document")
+                    slicing_failed = True
+                    return None
+
+        async def fetch_worker():
+            while True:
+                item = await fetch_queue.get()
+                if item is None:
+                    # Leave the sentinel for the other fetch workers
+                    fetch_queue.put_nowait(None)
+                    return
+                page_index, page_content, _, problems, custom_sys, custom_usr = item
+                start_time = time.time()
+                single_page_bytes = await get_page_bytes(page_index)
+                try:
+                    alternative_content = await self._fetch_alternative(
+                        single_page_bytes if single_page_bytes is not None else pdf_bytes,
+                        page_index,
+                        problems,
+                        custom_sys,
+                        custom_usr,
+                        single_page=single_page_bytes is not None
+                    )
+                except Exception as e:
+                    results.append(self._error_result(page_content, page_index, start_time, e))
+                    continue
+                await score_queue.put((page_index, page_content, problems, alternative_content, start_time))
+
+        async def score_worker():
+            while True:
+                item = await score_queue.get()
+                if item is None:
+                    return
+                page_index, page_content, problems, alternative_content, start_time = item
+                try:
+                    results.append(
+                        await self._score(page_content, alternative_content, page_index, problems, start_time)
+                    )
+                except Exception as e:
+                    results.append(self._error_result(page_content, page_index, start_time, e))
+
+        async def run_fetchers():
+            await asyncio.gather(*(fetch_worker() for _ in range(fetch_worker_count)))
+            # All fetches done - release the scoring workers
+            for _ in range(score_worker_count):
+                score_queue.put_nowait(None)
+
+        try:
+            await asyncio.gather(
+                run_fetchers(),
+                *(score_worker() for _ in range(score_worker_count))
             )
+        finally:
+            if pdf_document is not None:
+                pdf_document.close()
+
+        results.sort(key=lambda result: result.page_number)
+        return results
+
+    async def _detect_page(self, page, enabled_problems: List[str]) -> tuple:
+        """
+        Run problem detection for one page off the event loop.
+
+        Args:
+            page: Page from the Mistral response
+            enabled_problems: Problem patterns to check
+
+        Returns:
+            Tuple of (page, has_problem, detected_problems)
+        """
+        has_problem, detected_problems = await asyncio.to_thread(
+            self.has_any_problem, page.markdown, enabled_problems
+        )
+        return page, has_problem, detected_problems
 
     async def cross_validate_pages(
         self,
@@ -307,7 +606,9 @@ class ValidationService:
         """
         Cross-validate pages from Mistral extraction with parallel processing.
 
-        Performance optimized: Validates multiple pages concurrently using asyncio.gather().
+        Performance optimized: Detection and validation run as one streaming pass - each
+        page is queued for validation as soon as its detection completes, and validator
+        requests overlap with similarity scoring (see _run_validation_pipeline).
 
         Args:
             mistral_response: Response from Mistral API
@@ -333,92 +634,83 @@ class ValidationService:
 
         start_time = time.time()
 
-        # Random offset for sampling (0-9)
-        random_offset = random.randint(0, settings.VALIDATION_SAMPLE_RATE - 1)
-        logger.debug(f"Sample validation offset: {random_offset}")
+        # Deterministic per-document sampling offset
+        doc_id = _document_id(pdf_bytes)
+        logger.debug(f"Sample validation offset: {doc_id % settings.VALIDATION_SAMPLE_RATE}")
 
         problem_pages = []
-        pages_to_validate = []  # List of (page_index, page_content, reason, detected_problems, custom_system, custom_user) tuples
-
-        # First pass: Detect problems for ALL pages in parallel (OPTIMIZATION #5)
-        # This eliminates the 7-second sequential bottleneck by running problem detection concurrently
-        logger.info(f"Running problem detection in parallel for {len(mistral_response.pages)} pages...")
+        queued_count = 0
 
         # CRITICAL: Capture enabled_problems in main thread before parallel processing
         # settings.validation_problems_list is a @property - accessing it in thread pool can be inconsistent
         enabled_problems = settings.validation_problems_list
         logger.debug(f"Enabled problem patterns for parallel detection: {enabled_problems}")
 
-        # Create async tasks for problem detection (one per page)
-        # Using asyncio.to_thread() to run CPU-bound detection in thread pool
-        # Pass enabled_problems explicitly to ensure consistent detection across all threads
+        # Resolve image-validation prompts once instead of per image page
+        if workflow_name == "01_Fin_Reports":
+            # Use finance-specific prompts for 01_Fin_Reports workflow
+            image_system_prompt = settings.get_finance_image_system_prompt()
+            image_user_prompt = settings.get_finance_image_user_prompt_template()
+        else:
+            image_system_prompt = settings.get_image_validation_system_prompt(validator_name)
+            image_user_prompt = settings.get_image_validation_user_prompt_template(validator_name)
+
+        # Single streaming pass: the validation pipeline consumes pages as soon as
+        # their detection completes, instead of waiting for detection on every page
+        fetch_queue: asyncio.Queue = asyncio.Queue()
+        pipeline = asyncio.create_task(self._run_validation_pipeline(fetch_queue, pdf_bytes))
+
+        logger.info(f"Running problem detection in parallel for {len(mistral_response.pages)} pages...")
         detection_tasks = [
-            asyncio.to_thread(
-                self.has_any_problem,
-                page.markdown,
-                enabled_problems  # ← Explicit parameter for thread-safe access
-            )
+            self._detect_page(page, enabled_problems)
             for page in mistral_response.pages
         ]
 
-        # Wait for all detections to complete in parallel
-        # Expected: 100 pages in ~350ms (vs 7s sequential)
-        detection_results = await asyncio.gather(*detection_tasks)
-
-        # Process results to determine which pages need validation
-        for page, (has_problem, detected_problems) in zip(mistral_response.pages, detection_results):
-            page_index = page.index
-            page_content = page.markdown
-
-            should_validate = False
-            reason = ""
-            custom_system = None
-            custom_user = None
-
-            # Check if page has markdown images - use custom prompts
-            if 'markdown_images' in detected_problems:
-                # Use finance-specific prompts for 01_Fin_Reports workflow
-                if workflow_name == "01_Fin_Reports":
-                    custom_system = settings.get_finance_image_system_prompt()
-                    custom_user = settings.get_finance_image_user_prompt_template()
-                    logger.info(f"[Page {page_index}] Image detected in 01_Fin_Reports - using finance-specific validation prompts")
-                else:
-                    custom_system = settings.get_image_validation_system_prompt(validator_name)
-                    custom_user = settings.get_image_validation_user_prompt_template(validator_name)
-                    logger.info(f"[Page {page_index}] Image detected - using custom validation prompts")
-
-            if has_problem:
-                should_validate = True
-                reason = f"problems detected: {', '.join(detected_problems)}"
-                problem_pages.append(page_index)
-                logger.info(f"[Page {page_index}] Problems found: {', '.join(detected_problems)}")
-
-            # Check if should sample-validate (optimization: skip sampling if no problems and skip_sample_if_clean is enabled)
-            elif not settings.VALIDATION_SKIP_SAMPLE_IF_CLEAN and self.should_validate_page(page_index, len(mistral_response.pages), has_query, random_offset):
-                should_validate = True
-                reason = "sample validation"
-
-            # Add to validation queue if needed
-            if should_validate:
-                logger.info(f"[Page {page_index}] Queued for validation ({reason})")
-                pages_to_validate.append((page_index, page_content, reason, detected_problems, custom_system, custom_user))
-
-        # Second pass: Validate all pages in parallel
-        logger.info(f"Validating {len(pages_to_validate)} pages in parallel...")
-
-        validation_tasks = [
-            self.validate_page(
-                original_content=page_content,
-                page_pdf_bytes=pdf_bytes,
-                page_number=page_index,
-                detected_problems=problems,
-                custom_system_prompt=custom_sys,
-                custom_user_prompt_template=custom_usr
-            )
-            for page_index, page_content, _, problems, custom_sys, custom_usr in pages_to_validate
-        ]
-
-        validation_results = await asyncio.gather(*validation_tasks) if validation_tasks else []
+        try:
+            for detection in asyncio.as_completed(detection_tasks):
+                page, has_problem, detected_problems = await detection
+                page_index = page.index
+                page_content = page.markdown
+
+                should_validate = False
+                reason = ""
+                custom_system = None
+                custom_user = None
+
+                # Check if page has markdown images - use custom prompts
+                if 'markdown_images' in detected_problems:
+                    custom_system = image_system_prompt
+                    custom_user = image_user_prompt
+                    if workflow_name == "01_Fin_Reports":
+                        logger.info(f"[Page {page_index}] Image detected in 01_Fin_Reports - using finance-specific validation prompts")
+                    else:
+                        logger.info(f"[Page {page_index}] Image detected - using custom validation prompts")
+
+                if has_problem:
+                    should_validate = True
+                    reason = f"problems detected: {', '.join(detected_problems)}"
+                    problem_pages.append(page_index)
+                    logger.info(f"[Page {page_index}] Problems found: {', '.join(detected_problems)}")
+
+                # Check if should sample-validate (optimization: skip sampling if no problems and skip_sample_if_clean is enabled)
+                elif not settings.VALIDATION_SKIP_SAMPLE_IF_CLEAN and self.should_validate_page(page_index, len(mistral_response.pages), has_query, doc_id):
+                    should_validate = True
+                    reason = "sample validation"
+
+                # Hand the page straight to the validation pipeline
+                if should_validate:
+                    logger.info(f"[Page {page_index}] Queued for validation ({reason})")
+                    fetch_queue.put_nowait((page_index, page_content, reason, detected_problems, custom_system, custom_user))
+                    queued_count += 1
+        except BaseException:
+            pipeline.cancel()
+            raise
+        finally:
+            fetch_queue.put_nowait(None)
+
+        logger.info(f"Detection complete - {queued_count} pages queued for validation")
+        validation_results = await pipeline
+        problem_pages.sort()
 
         # Collect failed validations
         failed_validations = [
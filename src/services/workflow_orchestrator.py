@@ -9,10 +9,12 @@ from typing import Optional
 
 from src.workflows import get_workflow_for_query
 from src.workflows.workflow_types import WorkflowType
-from src.services.workflows.text_extraction_handler import TextExtractionHandler
-from src.services.workflows.azure_di_handler import AzureDIHandler
-from src.services.workflows.ocr_images_handler import OcrImagesHandler
-from src.services.workflows.gemini_handler import GeminiHandler
+from src.services.workflows.simple_handler import (
+    TextExtractionHandler,
+    AzureDIHandler,
+    OcrImagesHandler,
+    GeminiHandler
+)
 from src.services.workflows.default_handler import DefaultHandler
 from src.models.workflow_models import WorkflowResult
 from src.core.error_handling import WorkflowExecutionError
@@ -33,14 +35,17 @@ class WorkflowOrchestrator:
 
     def __init__(self):
         """Initialize orchestrator with all workflow handlers."""
+        # Handlers are stateless, so aliased workflows share one instance
+        default_handler = DefaultHandler()
+        gemini_handler = GeminiHandler()
         self.workflow_handlers = {
             WorkflowType.TEXT_EXTRACTION: TextExtractionHandler(),
             WorkflowType.AZURE_DOCUMENT_INTELLIGENCE: AzureDIHandler(),
             WorkflowType.OCR_WITH_IMAGES: OcrImagesHandler(),
-            WorkflowType.GEMINI_WF: GeminiHandler(),
-            WorkflowType.MISTRAL: DefaultHandler(),
-            WorkflowType.OPENAI: DefaultHandler(),  # Uses same handler as Mistral
-            WorkflowType.GEMINI: GeminiHandler(),  # Maps to same as GEMINI_WF
+            WorkflowType.GEMINI_WF: gemini_handler,
+            WorkflowType.MISTRAL: default_handler,
+            WorkflowType.OPENAI: default_handler,  # Uses same handler as Mistral
+            WorkflowType.GEMINI: gemini_handler,  # Maps to same as GEMINI_WF
         }
 
         logger.info("Workflow orchestrator initialized with all handlers")
@@ -5,17 +5,22 @@ This package provides specialized handlers for different PDF extraction workflow
 following the Strategy pattern for clean separation of concerns.
 """
 from .base_handler import BaseWorkflowHandler
-from .text_extraction_handler import TextExtractionHandler
-from .azure_di_handler import AzureDIHandler
-from .ocr_images_handler import OcrImagesHandler
-from .gemini_handler import GeminiHandler
-from .default_handler import DefaultHandler
+from .simple_handler import (
+    SimpleWorkflowHandler,
+    TextExtractionHandler,
+    AzureDIHandler,
+    OcrImagesHandler,
+    GeminiHandler
+)
+from .default_handler import DefaultHandler, drain_background_tasks
 
 __all__ = [
     "BaseWorkflowHandler",
+    "SimpleWorkflowHandler",
     "TextExtractionHandler",
     "AzureDIHandler",
     "OcrImagesHandler",
     "GeminiHandler",
     "DefaultHandler",
+    "drain_background_tasks",
 ]
@@ -52,10 +52,8 @@ class BaseWorkflowHandler(ABC):
 
     def _log_execution_start(self, workflow_name: str, pdf_path: str, query: str):
         """Log workflow execution start."""
-        logger.info(
-            f"Starting {workflow_name} workflow: "
-            f"pdf={pdf_path}, query={query}"
-        )
+        # Lazy %-formatting: arguments are only rendered if INFO is enabled
+        logger.info("Starting %s workflow: pdf=%s, query=%s", workflow_name, pdf_path, query)
 
     def _log_execution_complete(
         self,
@@ -64,9 +62,12 @@ class BaseWorkflowHandler(ABC):
         execution_time: float
     ):
         """Log workflow execution completion."""
-        logger.info(
-            f"Completed {workflow_name} workflow: "
-            f"sections={result.section_count}, "
-            f"validated={result.was_validated}, "
-            f"time={execution_time:.2f}s"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            # Guarded: section_count / was_validated are computed properties
+            logger.info(
+                "Completed %s workflow: sections=%d, validated=%s, time=%.2fs",
+                workflow_name,
+                result.section_count,
+                result.was_validated,
+                execution_time
+            )
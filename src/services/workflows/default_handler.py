@@ -5,28 +5,64 @@ Uses Mistral Document AI for extraction with optional cross-validation.
 Supports outline-based splitting, query filtering, and parallel processing.
 """
 import logging
+import re
 import time
 import asyncio
-from typing import Optional, List
+from collections import Counter
+from typing import Optional, List, Set
 from pathlib import Path
 
 from .base_handler import BaseWorkflowHandler
 from src.models.workflow_models import WorkflowResult, ExtractedSection
-from src.services.client_factory import get_client_factory
-from src.services.extraction_service import process_with_model
-from src.core.utils import filter_outlines_by_query, encode_chunks_to_base64_async
+from src.core.config import settings
+from src.core.constants import MARKDOWN_SECTION_SEPARATOR
+from src.services.extraction_service import get_pdf_processor, process_with_model
+from src.core.utils import filter_outlines_by_query, encode_pdf_to_base64
 from src.core.error_handling import WorkflowExecutionError
 
 logger = logging.getLogger(__name__)
 
-# Get clients from factory
-client_factory = get_client_factory()
-pdf_processor = client_factory.pdf_processor
+# Strong references to fire-and-forget tasks (the event loop only keeps weak ones)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _run_in_background(coro) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it, keeping it alive until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+async def drain_background_tasks() -> None:
+    """
+    Wait for pending background tasks (chunk cleanup) on the running loop.
+
+    Call before the event loop closes - on app shutdown, at the end of
+    asyncio.run() scripts and in tests - otherwise pending cleanups are
+    destroyed and their chunk files are left in the temp directory.
+    """
+    loop = asyncio.get_running_loop()
+    while pending := [task for task in _background_tasks if task.get_loop() is loop]:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+# Precedence of chunk validation statuses when aggregating (higher wins)
+_STATUS_PRIORITY = {"problems_fixed": 3, "warnings": 2, "passed": 1}
+
+# Characters not allowed in section filenames (\w is Unicode alnum + '_', so Hebrew titles survive)
+_UNSAFE_TITLE_CHARS = re.compile(r'[^\w \-]')
 
 
 class DefaultHandler(BaseWorkflowHandler):
     """Handler for default Mistral workflow with validation support."""
 
+    # Static part of the result metadata (copied into each result, never mutated)
+    _BASE_METADATA = {
+        "workflow": "mistral",
+        "extraction_method": "mistral_document_ai",
+        "model": "mistral-document-ai-2505"
+    }
+
     async def execute(
         self,
         pdf_path: str,
@@ -52,14 +88,18 @@ class DefaultHandler(BaseWorkflowHandler):
         Raises:
             WorkflowExecutionError: If extraction fails
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self._log_execution_start("Mistral", pdf_path, query)
 
+        pdf_processor = get_pdf_processor()
         pdf_chunks = []
         try:
-            # 1. Split PDF by outlines with metadata
-            pdf_chunks, outline_info = pdf_processor.split_with_outline_info(pdf_path)
-            logger.info(f"Split PDF into {len(pdf_chunks)} chunks")
+            # 1. Plan the outline split (chunk files are written by the pipeline below)
+            reader, page_ranges, outline_info = await asyncio.to_thread(
+                pdf_processor.plan_split_with_outline_info, pdf_path
+            )
+            chunk_count = len(page_ranges) if page_ranges is not None else 1
+            logger.info(f"Splitting PDF into {chunk_count} chunks")
 
             # 2. Filter outlines by query
             if outline_info:
@@ -70,38 +110,59 @@ class DefaultHandler(BaseWorkflowHandler):
             else:
                 filtered_outline_info = None
 
-            # 3. Pre-encode all chunks to base64 in parallel (3x speedup)
-            logger.info(f"Pre-encoding {len(pdf_chunks)} chunks to base64 in parallel...")
-            encoded_chunks = await encode_chunks_to_base64_async(pdf_chunks)
-
-            # 4. Process all chunks in parallel with asyncio.gather
-            logger.info(f"Processing {len(pdf_chunks)} chunks in parallel...")
+            # 3. Split and process as a pipeline: each chunk is submitted as soon as it is
+            # written, so API latency overlaps with writing the remaining chunks
+            logger.info(f"Processing {chunk_count} chunks in parallel...")
             has_query = bool(query and query.strip())
 
             # Determine workflow name for validation (e.g., "01_Fin_Reports")
             workflow_name = query if query and query.strip() else None
 
-            tasks = [
-                process_with_model(
-                    model_name="mistral",
-                    chunk_path=chunk_path,
-                    chunk_base64=chunk_base64,
-                    chunk_bytes=None,  # Memory optimization: read on-demand when validation needed
-                    has_query=has_query,
-                    enable_validation=enable_validation,
-                    workflow_name=workflow_name
-                )
-                for chunk_path, chunk_base64 in encoded_chunks
-            ]
-            results = await asyncio.gather(*tasks)
-
-            # 5. Unpack results (content, validation_report)
-            markdown_results = [content for content, _ in results]
-            validation_reports = [report for _, report in results]
+            # Bounded to avoid rate-limit backoff and connection pool exhaustion
+            semaphore = asyncio.Semaphore(max(1, settings.MAX_CONCURRENT_CHUNKS))
+
+            async def process_chunk(chunk_index: int, chunk_path: str):
+                async with semaphore:
+                    # Encode on demand - only MAX_CONCURRENT_CHUNKS base64 strings are alive at once
+                    chunk_base64 = await asyncio.to_thread(encode_pdf_to_base64, chunk_path)
+                    content, validation_report = await process_with_model(
+                        model_name="mistral",
+                        chunk_path=chunk_path,
+                        chunk_base64=chunk_base64,
+                        chunk_bytes=None,  # Memory optimization: read on-demand when validation needed
+                        has_query=has_query,
+                        enable_validation=enable_validation,
+                        workflow_name=workflow_name
+                    )
+                return chunk_index, content, validation_report
+
+            process_tasks = []
+            markdown_results: List[Optional[str]] = [None] * chunk_count
+            status_counts: Counter = Counter()
+            try:
+                if page_ranges is None:
+                    # Within size limit - the original PDF is the only chunk
+                    pdf_chunks.append(pdf_path)
+                    process_tasks.append(asyncio.create_task(process_chunk(0, pdf_path)))
+                else:
+                    async for chunk_index, chunk_path in pdf_processor.iter_chunks(reader, page_ranges):
+                        pdf_chunks.append(chunk_path)
+                        process_tasks.append(asyncio.create_task(process_chunk(chunk_index, chunk_path)))
+
+                # 4. Collect results as chunks finish (content in chunk order, validation statuses tallied)
+                for completed in asyncio.as_completed(process_tasks):
+                    chunk_index, content, validation_report = await completed
+                    markdown_results[chunk_index] = content
+                    if validation_report is not None:
+                        status_counts[validation_report.get("status", "unknown")] += 1
+            except BaseException:
+                for task in process_tasks:
+                    task.cancel()
+                raise
 
             logger.info(f"Completed parallel processing of {len(pdf_chunks)} chunks")
 
-            # 6. Build sections if we have filtered outlines
+            # 5. Build sections if we have filtered outlines
             sections = []
             if filtered_outline_info:
                 sections = self._build_sections(
@@ -110,21 +171,19 @@ class DefaultHandler(BaseWorkflowHandler):
                     Path(pdf_path).stem
                 )
 
-            # 7. Combine all results
+            # 6. Combine all results
             combined_markdown = pdf_processor.combine_markdown_results(markdown_results)
 
-            # 8. Aggregate validation reports
-            aggregated_validation = self._aggregate_validation_reports(validation_reports)
+            # 7. Aggregate validation reports
+            aggregated_validation = self._aggregate_validation_reports(status_counts)
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
-            # 9. Build result
+            # 8. Build result
             result = WorkflowResult(
                 content=combined_markdown,
                 metadata={
-                    "workflow": "mistral",
-                    "extraction_method": "mistral_document_ai",
-                    "model": "mistral-document-ai-2505",
+                    **self._BASE_METADATA,
                     "total_chunks": len(pdf_chunks),
                     "has_outlines": outline_info is not None,
                     "filtered_sections": len(filtered_outline_info) if filtered_outline_info else 0,
@@ -143,9 +202,9 @@ class DefaultHandler(BaseWorkflowHandler):
             raise WorkflowExecutionError(f"Mistral extraction failed: {str(e)}")
 
         finally:
-            # Cleanup temporary files
+            # Cleanup temporary files in the background - the result doesn't wait on unlinks
             if pdf_chunks:
-                await pdf_processor.cleanup_chunks(pdf_chunks, pdf_path)
+                _run_in_background(pdf_processor.cleanup_chunks(pdf_chunks, pdf_path))
 
     def _build_sections(
         self,
@@ -166,17 +225,20 @@ class DefaultHandler(BaseWorkflowHandler):
         sections = []
         for outline in filtered_outline_info:
             # Combine markdown for all chunks in this outline section
-            section_markdown = []
-            for chunk_idx in outline['chunk_indices']:
-                section_markdown.append(markdown_results[chunk_idx])
+            # (chunk_indices is a contiguous range - see split_with_outline_info)
+            chunk_indices = outline['chunk_indices']
+            section_markdown = (
+                markdown_results[chunk_indices[0]:chunk_indices[-1] + 1] if chunk_indices else []
+            )
 
-            combined = pdf_processor.combine_markdown_results(section_markdown)
+            # Same output as combine_markdown_results, as one join per section
+            if len(section_markdown) == 1:
+                combined = section_markdown[0]
+            else:
+                combined = MARKDOWN_SECTION_SEPARATOR.join(chunk.strip() for chunk in section_markdown)
 
             # Create safe filename from outline title
-            safe_title = "".join(
-                c if c.isalnum() or c in (' ', '-', '_') else '_'
-                for c in outline['title']
-            )
+            safe_title = _UNSAFE_TITLE_CHARS.sub('_', outline['title'])
             safe_title = safe_title.strip().replace(' ', '_')[:50]  # Limit length
 
             section_filename = f"{safe_title}_{base_filename}.md"
@@ -196,43 +258,27 @@ class DefaultHandler(BaseWorkflowHandler):
 
         return sections
 
-    def _aggregate_validation_reports(
-        self,
-        validation_reports: List[Optional[dict]]
-    ) -> Optional[dict]:
+    def _aggregate_validation_reports(self, status_counts: Counter) -> Optional[dict]:
         """Aggregate validation reports from multiple chunks.
 
         Args:
-            validation_reports: List of validation report dictionaries (or None)
+            status_counts: Count of validation report statuses across chunks
+                (chunks without a report are not counted)
 
         Returns:
             Aggregated validation report, or None if no validation was performed
         """
-        # Filter out None reports
-        valid_reports = [r for r in validation_reports if r is not None]
-
-        if not valid_reports:
+        if not status_counts:
             return None
 
-        # Count statuses
-        status_counts = {}
-        for report in valid_reports:
-            status = report.get("status", "unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-        # Determine overall status
-        if "problems_fixed" in status_counts:
-            overall_status = "problems_fixed"
-        elif "warnings" in status_counts:
-            overall_status = "warnings"
-        elif "passed" in status_counts:
-            overall_status = "passed"
-        else:
+        # Determine overall status (highest-precedence known status wins)
+        overall_status = max(status_counts, key=lambda status: _STATUS_PRIORITY.get(status, 0))
+        if overall_status not in _STATUS_PRIORITY:
             overall_status = "unknown"
 
         return {
             "enabled": True,
             "status": overall_status,
-            "chunks_validated": len(valid_reports),
-            "status_breakdown": status_counts
+            "chunks_validated": status_counts.total(),
+            "status_breakdown": dict(status_counts)
         }
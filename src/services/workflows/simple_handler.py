@@ -0,0 +1,145 @@
+"""
+Single-call workflow handlers.
+
+Text extraction, Azure Document Intelligence, OCR with images and Gemini page-by-page
+each delegate the whole extraction to one process_* function and wrap its output
+in a WorkflowResult. They share SimpleWorkflowHandler and differ only in configuration.
+"""
+import logging
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+
+from .base_handler import BaseWorkflowHandler
+from src.models.workflow_models import WorkflowResult
+from src.services.extraction_service import (
+    process_text_extraction,
+    process_azure_document_intelligence,
+    process_ocr_with_images,
+    process_gemini_wf
+)
+from src.core.error_handling import WorkflowExecutionError
+
+logger = logging.getLogger(__name__)
+
+ProcessFunction = Callable[..., Awaitable[Tuple[str, dict]]]
+
+
+class SimpleWorkflowHandler(BaseWorkflowHandler):
+    """Handler for workflows that run a single process_* function.
+
+    These workflows don't split by outlines and don't use cross-validation.
+    """
+
+    def __init__(
+        self,
+        workflow_name: str,
+        workflow_label: str,
+        process_fn: ProcessFunction,
+        error_name: str
+    ):
+        """Initialize handler.
+
+        Args:
+            workflow_name: Name used in execution logs (e.g., "Gemini")
+            workflow_label: Value of the "workflow" metadata field (e.g., "gemini-wf")
+            process_fn: Extraction function called as process_fn(pdf_path=..., query=...)
+                returning (markdown, metadata)
+            error_name: Extraction name used in the raised error (e.g., "Gemini")
+        """
+        self.workflow_name = workflow_name
+        self.workflow_label = workflow_label
+        self.process_fn = process_fn
+        self._error_message = f"{error_name} extraction failed"
+        # Static part of the result metadata (copied into each result, never mutated)
+        self._base_metadata = {"workflow": workflow_label}
+
+    async def execute(
+        self,
+        pdf_path: str,
+        query: str,
+        enable_validation: Optional[bool] = None
+    ) -> WorkflowResult:
+        """Execute the workflow.
+
+        Args:
+            pdf_path: Path to the PDF file
+            query: Query string passed to the process function
+            enable_validation: Ignored for these workflows (no cross-validation)
+
+        Returns:
+            WorkflowResult with extracted content
+
+        Raises:
+            WorkflowExecutionError: If extraction fails
+        """
+        start_time = time.perf_counter()
+        self._log_execution_start(self.workflow_name, pdf_path, query)
+
+        try:
+            combined_markdown, metadata = await self.process_fn(
+                pdf_path=pdf_path,
+                query=query
+            )
+
+            execution_time = time.perf_counter() - start_time
+
+            # Build result
+            result = WorkflowResult(
+                content=combined_markdown,
+                metadata={
+                    **metadata,
+                    "execution_time": execution_time,
+                    **self._base_metadata
+                },
+                sections=None,  # Doesn't split by outlines
+                validation_report=None  # No validation for this workflow
+            )
+
+            self._log_execution_complete(self.workflow_name, result, execution_time)
+            return result
+
+        except Exception as e:
+            logger.error(f"{self.workflow_name} workflow failed: {e}")
+            raise WorkflowExecutionError(f"{self._error_message}: {str(e)}")
+
+
+class TextExtractionHandler(SimpleWorkflowHandler):
+    """Handler for text extraction workflow using pdfplumber.
+
+    Extracts tables from digitally-generated PDFs without OCR/AI.
+    """
+
+    def __init__(self):
+        super().__init__("TextExtraction", "text_extraction", process_text_extraction, "Text")
+
+
+class AzureDIHandler(SimpleWorkflowHandler):
+    """Handler for Azure Document Intelligence workflow.
+
+    Intelligent table extraction and merging for tables spanning multiple pages.
+    """
+
+    def __init__(self):
+        super().__init__(
+            "AzureDocumentIntelligence",
+            "azure_document_intelligence",
+            process_azure_document_intelligence,
+            "Azure DI"
+        )
+
+
+class OcrImagesHandler(SimpleWorkflowHandler):
+    """Handler for OCR with Images workflow (Mistral + OpenAI).
+
+    The query is used as the prompt for image extraction.
+    """
+
+    def __init__(self):
+        super().__init__("OcrWithImages", "ocr_with_images", process_ocr_with_images, "OCR with images")
+
+
+class GeminiHandler(SimpleWorkflowHandler):
+    """Handler for Gemini page-by-page workflow."""
+
+    def __init__(self):
+        super().__init__("Gemini", "gemini-wf", process_gemini_wf, "Gemini")
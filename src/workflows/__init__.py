@@ -5,7 +5,9 @@ This module provides type-safe workflow definitions and routing logic.
 """
 from .workflow_types import WorkflowType, WORKFLOW_NAMES
 from .workflow_router import (
+    classify_query,
     get_workflow_for_query,
+    reset_routing_cache,
     is_text_extraction_query,
     is_azure_document_intelligence_query,
     is_ocr_with_images_query,
@@ -15,7 +17,9 @@ from .workflow_router import (
 __all__ = [
     "WorkflowType",
     "WORKFLOW_NAMES",
+    "classify_query",
     "get_workflow_for_query",
+    "reset_routing_cache",
     "is_text_extraction_query",
     "is_azure_document_intelligence_query",
     "is_ocr_with_images_query",
@@ -4,19 +4,146 @@ Workflow routing logic for PDF extraction.
 Determines which workflow to use based on query patterns.
 """
 import logging
-from typing import Optional
+import re
+from functools import lru_cache
+from typing import List, Optional, Pattern, Tuple
 
 from src.core.config import settings
 from .workflow_types import WorkflowType
 
 logger = logging.getLogger(__name__)
 
+# Compiled matcher over all QUERY_WORKFLOW_MAPPING patterns (built on first use)
+_pattern_matcher: Optional[Tuple[Pattern, List[Tuple[str, WorkflowType]]]] = None
+
+
+# Workflow for queries that match no pattern (resolved on first use)
+_default_workflow: Optional[WorkflowType] = None
+
+
+def _get_default_workflow() -> WorkflowType:
+    """
+    Get the default workflow from QUERY_WORKFLOW_MAPPING["default"].
+
+    Returns:
+        Default WorkflowType (MISTRAL if not configured)
+    """
+    global _default_workflow
+    if _default_workflow is None:
+        default_workflow_str = settings.QUERY_WORKFLOW_MAPPING.get("default", "mistral")
+        _default_workflow = _string_to_workflow_type(default_workflow_str)
+    return _default_workflow
+
+
+def _get_pattern_matcher() -> Tuple[Pattern, List[Tuple[str, WorkflowType]]]:
+    """
+    Get the compiled query pattern matcher.
+
+    All mapping patterns are folded into one regex so a query is scanned once instead
+    of once per pattern. Each pattern is a capture group inside a lookahead, so every
+    position reports the earliest-listed pattern starting there; taking the lowest group
+    over the whole query keeps the mapping's order as the match priority.
+
+    Returns:
+        Tuple of (compiled regex, list of (pattern, workflow) indexed by group number - 1)
+    """
+    global _pattern_matcher
+    if _pattern_matcher is None:
+        entries = [
+            (pattern, _string_to_workflow_type(workflow_str))
+            for pattern, workflow_str in settings.QUERY_WORKFLOW_MAPPING.items()
+            if pattern != "default"
+        ]
+        alternatives = "|".join(f"({re.escape(pattern.lower())})" for pattern, _ in entries)
+        # An empty mapping compiles to a pattern that never matches
+        regex = re.compile(f"(?=(?:{alternatives}))" if entries else r"(?!)")
+        _pattern_matcher = (regex, entries)
+    return _pattern_matcher
+
+
+def _match_pattern(query_lower: str) -> Optional[Tuple[str, WorkflowType]]:
+    """
+    Find the highest-priority mapping pattern contained in the query.
+
+    Args:
+        query_lower: Lowercased, stripped query
+
+    Returns:
+        (pattern, workflow) of the first matching mapping entry, or None
+    """
+    regex, entries = _get_pattern_matcher()
+    best = None
+    for match in regex.finditer(query_lower):
+        if best is None or match.lastindex < best:
+            best = match.lastindex
+            if best == 1:
+                break
+    return entries[best - 1] if best is not None else None
+
+
+@lru_cache(maxsize=2048)
+def _classify(query: Optional[str]) -> Tuple[WorkflowType, Optional[str]]:
+    """
+    Resolve a query to its workflow (memoized, no logging).
+
+    Args:
+        query: Search query string (can be None or empty)
+
+    Returns:
+        Tuple of (workflow, matched pattern or None when the default was used)
+    """
+    # Empty / whitespace-only queries can't match a pattern - skip lowercasing and the scan
+    if not query or query.isspace():
+        return _get_default_workflow(), None
+
+    query_lower = query.lower().strip()
+
+    # Check for exact or partial matches in the mapping (single pass over the query)
+    matched = _match_pattern(query_lower)
+    if matched is not None:
+        pattern, workflow = matched
+        return workflow, pattern
+
+    # Default fallback
+    return _get_default_workflow(), None
+
+
+def reset_routing_cache() -> None:
+    """
+    Drop the compiled matcher, the default workflow and the memoized classifications.
+
+    Routing state is built from settings.QUERY_WORKFLOW_MAPPING on first use, so call
+    this after the mapping changes (settings reloaded or patched) to route by the new one.
+    """
+    global _pattern_matcher, _default_workflow
+    _pattern_matcher = None
+    _default_workflow = None
+    _classify.cache_clear()
+
+
+def classify_query(query: Optional[str]) -> WorkflowType:
+    """
+    Classify a query into its workflow.
+
+    Single classification entrypoint: callers that need to branch on the workflow
+    should switch on the returned enum (e.g. a dict of handlers) rather than chain
+    the is_*_query helpers. Results are memoized per query.
+
+    Args:
+        query: Search query string (can be None or empty)
+
+    Returns:
+        WorkflowType enum value for the appropriate workflow
+    """
+    return _classify(query)[0]
+
 
 def get_workflow_for_query(query: Optional[str]) -> WorkflowType:
     """
     Determine which workflow to use based on query pattern.
 
     Uses the QUERY_WORKFLOW_MAPPING from config to map query patterns to workflows.
+    Same result as classify_query, but logs the routing decision.
 
     Args:
         query: Search query string (can be None or empty)
@@ -24,25 +151,14 @@ def get_workflow_for_query(query: Optional[str]) -> WorkflowType:
     Returns:
         WorkflowType enum value for the appropriate workflow
     """
-    if not query:
-        default_workflow_str = settings.QUERY_WORKFLOW_MAPPING.get("default", "mistral")
-        return _string_to_workflow_type(default_workflow_str)
-
-    query_lower = query.lower().strip()
+    workflow, pattern = _classify(query)
 
-    # Check for exact or partial matches in the mapping
-    for pattern, workflow_str in settings.QUERY_WORKFLOW_MAPPING.items():
-        if pattern == "default":
-            continue
-        if pattern.lower() in query_lower:
-            workflow = _string_to_workflow_type(workflow_str)
+    if query and logger.isEnabledFor(logging.INFO):
+        if pattern is not None:
             logger.info(f"Query '{query}' matched pattern '{pattern}' -> workflow: {workflow}")
-            return workflow
+        else:
+            logger.info(f"Query '{query}' using default workflow: {workflow}")
 
-    # Default fallback
-    default_workflow_str = settings.QUERY_WORKFLOW_MAPPING.get("default", "mistral")
-    workflow = _string_to_workflow_type(default_workflow_str)
-    logger.info(f"Query '{query}' using default workflow: {workflow}")
     return workflow
 
 
@@ -56,7 +172,7 @@ def is_text_extraction_query(query: str) -> bool:
     Returns:
         True if query maps to text_extraction workflow
     """
-    return get_workflow_for_query(query) == WorkflowType.TEXT_EXTRACTION
+    return classify_query(query) is WorkflowType.TEXT_EXTRACTION
 
 
 def is_azure_document_intelligence_query(query: str) -> bool:
@@ -69,7 +185,7 @@ def is_azure_document_intelligence_query(query: str) -> bool:
     Returns:
         True if query maps to azure_document_intelligence workflow
     """
-    return get_workflow_for_query(query) == WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
+    return classify_query(query) is WorkflowType.AZURE_DOCUMENT_INTELLIGENCE
 
 
 def is_ocr_with_images_query(query: str) -> bool:
@@ -82,7 +198,7 @@ def is_ocr_with_images_query(query: str) -> bool:
     Returns:
         True if query maps to ocr_with_images workflow
     """
-    return get_workflow_for_query(query) == WorkflowType.OCR_WITH_IMAGES
+    return classify_query(query) is WorkflowType.OCR_WITH_IMAGES
 
 
 def is_gemini_wf_query(query: str) -> bool:
@@ -95,7 +211,7 @@ def is_gemini_wf_query(query: str) -> bool:
     Returns:
         True if query maps to gemini-wf workflow
     """
-    return get_workflow_for_query(query) == WorkflowType.GEMINI_WF
+    return classify_query(query) is WorkflowType.GEMINI_WF
 
 
 def _string_to_workflow_type(workflow_str: str) -> WorkflowType:
@@ -106,24 +222,11 @@ def _string_to_workflow_type(workflow_str: str) -> WorkflowType:
         workflow_str: String workflow identifier (e.g., "mistral", "openai")
 
     Returns:
-        Corresponding WorkflowType enum value
-
-    Raises:
-        ValueError: If workflow string is not recognized
-    """
-    workflow_map = {
-        "mistral": WorkflowType.MISTRAL,
-        "text_extraction": WorkflowType.TEXT_EXTRACTION,
-        "azure_document_intelligence": WorkflowType.AZURE_DOCUMENT_INTELLIGENCE,
-        "openai": WorkflowType.OPENAI,
-        "gemini": WorkflowType.GEMINI,
-        "gemini-wf": WorkflowType.GEMINI_WF,
-        "ocr_with_images": WorkflowType.OCR_WITH_IMAGES,
-    }
-
-    workflow_type = workflow_map.get(workflow_str.lower())
-    if workflow_type is None:
+        Corresponding WorkflowType enum value (MISTRAL if the string is not recognized)
+    """
+    # Enum values are the workflow strings, so the enum itself is the lookup table
+    try:
+        return WorkflowType(workflow_str.lower())
+    except ValueError:
         logger.warning(f"Unknown workflow string '{workflow_str}', defaulting to MISTRAL")
         return WorkflowType.MISTRAL
-
-    return workflow_type
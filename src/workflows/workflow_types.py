@@ -6,8 +6,11 @@ Replaces string-based workflow identification with type-safe enum.
 from enum import Enum
 
 
-class WorkflowType(Enum):
-    """Supported PDF extraction workflows."""
+class WorkflowType(str, Enum):
+    """Supported PDF extraction workflows.
+
+    Members are str instances, so they compare equal to and format as their value.
+    """
     MISTRAL = "mistral"
     TEXT_EXTRACTION = "text_extraction"
     AZURE_DOCUMENT_INTELLIGENCE = "azure_document_intelligence"
@@ -16,9 +19,8 @@ class WorkflowType(Enum):
     GEMINI_WF = "gemini-wf"
     OCR_WITH_IMAGES = "ocr_with_images"
 
-    def __str__(self) -> str:
-        """Return string value of the workflow type."""
-        return self.value
+    # str(member) == value without a Python-level call (StrEnum needs Python 3.11)
+    __str__ = str.__str__
 
 
 # Workflow display names for logging
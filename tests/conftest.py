@@ -0,0 +1,52 @@
+"""
+Shared pytest fixtures.
+
+Only generic helpers live here so unit runs stay free of the FastAPI app and
+its auth settings. The app, API clients, test PDF discovery and result
+reporting live in tests/integration/conftest.py.
+"""
+import asyncio
+
+import pytest
+from typing import Tuple
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (not available on Windows)
+    uvloop = None
+
+
+# Configuration
+FAKE_PDF_BYTES = b"%PDF-1.4\ntest"  # Placeholder PDF for unit tests that mock the parser/API
+
+
+def pytest_addoption(parser):
+    """Register integration test command-line options (only initial conftests can add options)."""
+    parser.addoption(
+        "--keep-outputs",
+        action="store_true",
+        default=False,
+        help="Persist and extract ZIP outputs from integration tests (default: inspect in memory)"
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed (picked up by pytest-asyncio)."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def fake_pdf_path(tmp_path_factory) -> str:
+    """Write a placeholder PDF once per session and return its path."""
+    path = tmp_path_factory.mktemp("pdf") / "fake.pdf"
+    path.write_bytes(FAKE_PDF_BYTES)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def fake_pdf(fake_pdf_path) -> Tuple[str, bytes]:
+    """Placeholder PDF path together with its content, for tests that verify the bytes."""
+    return fake_pdf_path, FAKE_PDF_BYTES
@@ -0,0 +1,312 @@
+"""
+Integration test fixtures.
+
+The TestClient and test PDF discovery are session-scoped so they are built
+once per run and shared by every integration module. The app is imported at
+collection time, after the auth settings are set in the environment.
+pytest.ini keeps tests/integration out of the default run ('pytest',
+'pytest tests/'), so this conftest is only loaded by 'pytest tests/integration';
+unit runs never build the app, change the auth environment or clear the
+integration outputs.
+
+Run xdist sessions as 'pytest tests/integration -n auto' so the controller
+loads this conftest and aggregates the per-test results.
+"""
+import base64
+import io
+import json
+import mmap
+import os
+import shutil
+import time
+
+import pytest
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Auth settings come from the environment, so set them before main (and settings) is imported.
+# Export PYTEST_APP_READY=1 to run against an environment that is already configured.
+if os.environ.get("PYTEST_APP_READY") != "1":
+    os.environ["API_KEY"] = "test-key"
+    os.environ["REQUIRE_API_KEY"] = "true"
+TEST_API_KEY = os.environ.get("API_KEY", "")
+AUTH_HEADERS = {"Authorization": f"Bearer {TEST_API_KEY}"}
+
+import httpx  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from main import app  # noqa: E402
+from src.services.workflows import drain_background_tasks  # noqa: E402
+
+
+# Configuration
+TEST_PDFS_DIR = Path(__file__).parent.parent / "test_pdfs"
+OUTPUT_DIR = Path(__file__).parent.parent / "integration_output"
+TIMEOUT = 300.0  # 5 minutes for large PDFs
+MAX_CONCURRENT_UPLOADS = 8  # In-flight requests per async test (bounds server-side load and Mistral rate limits)
+RESULTS_DIR = OUTPUT_DIR / "results"  # Per-test result files, aggregated at session end
+BASE64_BLOCK_SIZE = 3 * (1 << 18)  # Multiple of 3 so encoded blocks concatenate without padding
+SESSION_TIMESTAMP_KEY = pytest.StashKey[str]()  # Run start time, shared by all summaries
+PDF_RESULT_PROPERTY = "pdf_result"  # user_properties key read by pytest_terminal_summary
+VERBOSE_OUTPUT_LEVEL = 2  # -vv (or -v on top of the --verbose in pytest.ini)
+
+# Test PDFs, globbed once at import; sorted so parametrize ids and xdist distribution are deterministic
+PDF_FILES: Tuple[Path, ...] = tuple(sorted(TEST_PDFS_DIR.glob("*.pdf"))) if TEST_PDFS_DIR.exists() else ()
+
+
+def encode_file_base64(path: Path) -> str:
+    """
+    Base64-encode a file block by block from a memory map.
+
+    Avoids holding the raw bytes, the encoded bytes and the decoded string
+    of a large PDF in memory at the same time.
+
+    Args:
+        path: File to encode
+
+    Returns:
+        Base64 string
+    """
+    buffer = io.BytesIO()
+    with open(path, "rb") as f:
+        if path.stat().st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset in range(0, len(mapped), BASE64_BLOCK_SIZE):
+                buffer.write(base64.b64encode(mapped[offset:offset + BASE64_BLOCK_SIZE]))
+    return buffer.getvalue().decode("ascii")
+
+
+def write_json(path: Path, obj: Any, indent: bool = False) -> None:
+    """
+    Serialize to UTF-8 JSON and write it in a single call.
+
+    orjson produces UTF-8 bytes directly; the stdlib encoder is only used
+    when orjson isn't installed. Non-ASCII text (e.g. Hebrew) is written
+    as-is in both cases, like ensure_ascii=False.
+
+    Args:
+        path: Destination file
+        obj: JSON-serializable object
+        indent: Pretty-print with a 2-space indent
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        path.write_bytes(orjson.dumps(obj, option=option))
+    else:
+        path.write_bytes(json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8"))
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_xdist_worker(config) -> bool:
+    """Return True when running inside a pytest-xdist worker process."""
+    return hasattr(config, "workerinput")
+
+
+def record_result(
+    test_name: str,
+    result: Dict[str, Any],
+    record_property: Optional[Callable[[str, Any], None]] = None
+) -> None:
+    """
+    Record a single per-file test result for the session summary.
+
+    Each result goes to its own JSON file so parallel xdist workers never
+    write to the same file. When record_property is given, the result is
+    also attached to the test report for the terminal summary.
+
+    Args:
+        test_name: Summary group (e.g., "extract_endpoint")
+        result: Result dict with at least "file" and "status" keys
+        record_property: The test's record_property fixture
+    """
+    if record_property is not None:
+        record_property(PDF_RESULT_PROPERTY, {
+            "endpoint": test_name,
+            "file": result["file"],
+            "status": result["status"],
+            "processing_time": result.get("processing_time")
+        })
+
+    result_dir = RESULTS_DIR / test_name
+    result_dir.mkdir(parents=True, exist_ok=True)
+    result_path = result_dir / f"{Path(result['file']).stem}.json"
+    write_json(result_path, result)
+
+
+def pytest_configure(config):
+    """
+    Record the session timestamp and clear per-test results left over from a previous run.
+
+    pytest_sessionstart only reaches initial conftests, while pytest_configure is
+    also called for conftests loaded during collection, so this runs whenever
+    integration tests are collected.
+    """
+    config.stash[SESSION_TIMESTAMP_KEY] = time.strftime("%Y-%m-%d %H:%M:%S")
+
+    if not _is_xdist_worker(config) and RESULTS_DIR.exists():
+        shutil.rmtree(RESULTS_DIR)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Aggregate per-test results into one summary JSON per test group."""
+    if _is_xdist_worker(session.config) or not RESULTS_DIR.exists():
+        return
+
+    timestamp = session.config.stash[SESSION_TIMESTAMP_KEY]
+
+    for result_dir in sorted(p for p in RESULTS_DIR.iterdir() if p.is_dir()):
+        test_name = result_dir.name
+        results = [
+            loads_json(path.read_bytes())
+            for path in sorted(result_dir.glob("*.json"))
+        ]
+        successful = sum(1 for r in results if r["status"] == "success")
+
+        summary = {
+            "test_name": test_name,
+            "timestamp": timestamp,
+            "total_files": len(results),
+            "successful": successful,
+            "failed": len(results) - successful,
+            "results": results
+        }
+
+        write_json(OUTPUT_DIR.joinpath(f"{test_name}_summary.json"), summary, indent=True)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print one results table for all per-PDF results recorded during the run."""
+    pdf_results = [
+        value
+        for reports in terminalreporter.stats.values()
+        for report in reports
+        if getattr(report, "when", None) == "call"
+        for name, value in getattr(report, "user_properties", ())
+        if name == PDF_RESULT_PROPERTY
+    ]
+    if not pdf_results:
+        return
+
+    terminalreporter.section("PDF extraction results")
+    for result in sorted(pdf_results, key=lambda r: (r["endpoint"], r["file"])):
+        mark = "✓" if result["status"] == "success" else "✗"
+        terminalreporter.write_line(
+            f"{mark} {result['endpoint']}: {result['file']} ({result['processing_time']})"
+        )
+
+    failed = sum(1 for r in pdf_results if r["status"] != "success")
+    terminalreporter.write_line(
+        f"Total: {len(pdf_results)}, Success: {len(pdf_results) - failed}, Failed: {failed}"
+    )
+    terminalreporter.write_line(f"Summaries saved to: {OUTPUT_DIR}")
+
+
+@pytest.fixture(scope="session")
+def keep_outputs(request) -> bool:
+    """Whether integration tests should persist ZIP outputs to disk."""
+    return request.config.getoption("--keep-outputs")
+
+
+@pytest.fixture(scope="session")
+def vprint(pytestconfig) -> Callable[..., None]:
+    """print() that only emits at VERBOSE_OUTPUT_LEVEL, keeping large runs quiet."""
+    if pytestconfig.get_verbosity() >= VERBOSE_OUTPUT_LEVEL:
+        return print
+    return lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    Create TestClient for API calls.
+
+    Entered as a context manager so requests share one event loop and the app's
+    lifespan runs, draining background chunk cleanup on shutdown.
+    """
+    with TestClient(app, headers=AUTH_HEADERS) as client:
+        yield client
+
+
+@pytest.fixture
+async def drain_background():
+    """Wait for background chunk cleanup before the test's event loop closes (direct pipeline calls)."""
+    yield
+    await drain_background_tasks()
+
+
+@pytest.fixture
+async def async_api_client(drain_background):
+    """
+    Create async HTTP client for API calls.
+
+    Function-scoped so the client lives on the test's own event loop and is
+    closed when the test ends; with ASGITransport it holds no connections, so
+    building one per test is cheap. ASGITransport doesn't run the app's
+    lifespan, so background cleanup is drained by drain_background instead.
+    """
+    # ASGITransport calls the app in-process with no connection pool (httpx ignores
+    # `limits` with a custom transport); concurrency is bounded per test by MAX_CONCURRENT_UPLOADS
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+        headers=AUTH_HEADERS,
+        timeout=TIMEOUT
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def setup_directories():
+    """Set up test directories before integration tests run."""
+    # Create output directory if it doesn't exist
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Create test PDFs directory if it doesn't exist
+    TEST_PDFS_DIR.mkdir(parents=True, exist_ok=True)
+
+    yield
+
+    # Cleanup can be added here if needed
+    print(f"\nTest outputs saved to: {OUTPUT_DIR}")
+
+
+@pytest.fixture(scope="session")
+def test_pdf_files() -> Tuple[Path, ...]:
+    """
+    Get all PDF files from test directory.
+
+    Returns:
+        Sorted tuple of PDF file paths
+    """
+    if not PDF_FILES:
+        pytest.skip(f"No PDF files found in {TEST_PDFS_DIR}. Add PDFs to run integration tests.")
+
+    return PDF_FILES
+
+
+@pytest.fixture(scope="session")
+def pdf_corpus(test_pdf_files) -> Dict[Path, Dict[str, Any]]:
+    """
+    Read every test PDF once and cache its bytes and base64 encoding.
+
+    Returns:
+        Dict mapping PDF path to {"bytes": raw bytes, "b64": base64 string}
+    """
+    return {
+        pdf_path: {
+            "bytes": pdf_path.read_bytes(),
+            "b64": encode_file_base64(pdf_path)
+        }
+        for pdf_path in test_pdf_files
+    }
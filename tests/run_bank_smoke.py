@@ -0,0 +1,36 @@
+"""
+Run the bank statement smoke scripts together.
+
+Text extraction (test_bank_extraction) and Azure DI (test_bank_statements)
+are independent, so they run concurrently under one event loop: total wall
+time is the slower of the two instead of their sum.
+
+Usage:
+    python tests/run_bank_smoke.py
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, _REPO_ROOT)
+
+from tests.test_bank_extraction import test_extraction
+from tests.test_bank_statements import test_bank_statements
+
+# PDF used by both scripts (relative to the repository root, like the scripts)
+BANK_STATEMENTS_PDF = "data/bank_statements.pdf"
+
+
+async def run_bank_smoke() -> None:
+    """Run both bank statement smoke scripts concurrently."""
+    await asyncio.gather(test_extraction(), test_bank_statements())
+
+
+if __name__ == "__main__":
+    if not os.path.isfile(BANK_STATEMENTS_PDF):
+        print(f"Skipping bank smoke run: PDF not found at {BANK_STATEMENTS_PDF}")
+        sys.exit(0)
+
+    asyncio.run(run_bank_smoke())
@@ -6,22 +6,37 @@ This script tests:
 2. Request with invalid Bearer token (should fail with 403)
 3. Request with valid Bearer token (should succeed)
 """
-import requests
+import httpx
+import pytest
 import sys
 from pathlib import Path
 
 # API configuration
 API_URL = "http://localhost:8000"
 TEST_API_KEY = "test_key_12345"  # Set this in your .env file as API_KEY
+AUTH_HEADERS = {"Authorization": f"Bearer {TEST_API_KEY}"}
 
 
-def test_no_bearer_token():
+
+def make_client() -> httpx.Client:
+    """Keep-alive client so all tests share one connection to the server."""
+    return httpx.Client(base_url=API_URL, timeout=30.0)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client shared by the tests in this module, closed when they finish."""
+    with make_client() as client:
+        yield client
+
+
+def test_no_bearer_token(client: httpx.Client):
     """Test request without Bearer token."""
     print("=" * 80)
     print("TEST 1: Request without Bearer token")
     print("=" * 80)
 
-    response = requests.get(f"{API_URL}/")
+    response = client.get("/")
 
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
@@ -40,14 +55,14 @@ def test_no_bearer_token():
     print()
 
 
-def test_invalid_bearer_token():
+def test_invalid_bearer_token(client: httpx.Client):
     """Test request with invalid Bearer token."""
     print("=" * 80)
     print("TEST 2: Request with invalid Bearer token")
     print("=" * 80)
 
     headers = {"Authorization": "Bearer wrong_key"}
-    response = requests.get(f"{API_URL}/", headers=headers)
+    response = client.get("/", headers=headers)
 
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
@@ -60,14 +75,13 @@ def test_invalid_bearer_token():
     print()
 
 
-def test_valid_bearer_token():
+def test_valid_bearer_token(client: httpx.Client):
     """Test request with valid Bearer token."""
     print("=" * 80)
     print("TEST 3: Request with valid Bearer token")
     print("=" * 80)
 
-    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
-    response = requests.get(f"{API_URL}/", headers=headers)
+    response = client.get("/", headers=AUTH_HEADERS)
 
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
@@ -80,14 +94,13 @@ def test_valid_bearer_token():
     print()
 
 
-def test_health_endpoint():
+def test_health_endpoint(client: httpx.Client):
     """Test health endpoint with valid Bearer token."""
     print("=" * 80)
     print("TEST 4: Health endpoint with valid Bearer token")
     print("=" * 80)
 
-    headers = {"Authorization": f"Bearer {TEST_API_KEY}"}
-    response = requests.get(f"{API_URL}/health", headers=headers)
+    response = client.get("/health", headers=AUTH_HEADERS)
 
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.json()}")
@@ -118,24 +131,25 @@ if __name__ == "__main__":
     input("Press Enter to continue...")
     print()
 
+    client = make_client()
     try:
         # Test 1: No Bearer token
-        test_no_bearer_token()
+        test_no_bearer_token(client)
 
         # Test 2: Invalid Bearer token
-        test_invalid_bearer_token()
+        test_invalid_bearer_token(client)
 
         # Test 3: Valid Bearer token
-        test_valid_bearer_token()
+        test_valid_bearer_token(client)
 
         # Test 4: Health endpoint
-        test_health_endpoint()
+        test_health_endpoint(client)
 
         print("=" * 80)
         print("ALL TESTS COMPLETED")
         print("=" * 80)
 
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ ERROR: Could not connect to API server")
         print("Make sure the server is running on http://localhost:8000")
         sys.exit(1)
@@ -144,3 +158,5 @@ if __name__ == "__main__":
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        client.close()
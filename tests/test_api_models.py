@@ -1,148 +1,181 @@
 """
 Unit tests for API models (Base64FileRequest and ExtractionResponse).
 """
-import unittest
 import base64
+
+import pytest
 from pydantic import ValidationError
 
+from src.core.error_handling import FileEncodingError
 from src.models.api_models import Base64FileRequest, ExtractionResponse
+from src.services.pdf_input_handler import PDFInputHandler
 
 
-class TestBase64FileRequest(unittest.TestCase):
-    """Test cases for Base64FileRequest model."""
+@pytest.fixture(scope="session")
+def valid_base64() -> str:
+    """A simple base64 string (encoding "test pdf content")."""
+    return base64.b64encode(b"test pdf content").decode('utf-8')
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create a simple base64 string (encoding "test pdf content")
-        self.valid_base64 = base64.b64encode(b"test pdf content").decode('utf-8')
 
-    def test_valid_request(self):
-        """Test creating request with valid data."""
-        request = Base64FileRequest(
-            filename="test.pdf",
-            file_content=self.valid_base64
-        )
-        self.assertEqual(request.filename, "test.pdf")
-        self.assertEqual(request.file_content, self.valid_base64)
-
-    def test_filename_without_pdf_extension(self):
-        """Test that filename must end with .pdf."""
-        with self.assertRaises(ValidationError) as context:
-            Base64FileRequest(
-                filename="test.txt",
-                file_content=self.valid_base64
-            )
-        self.assertIn("must end with .pdf", str(context.exception))
-
-    def test_filename_case_insensitive(self):
-        """Test that .PDF extension works (case insensitive)."""
-        request = Base64FileRequest(
-            filename="test.PDF",
-            file_content=self.valid_base64
-        )
-        self.assertEqual(request.filename, "test.PDF")
-
-    def test_invalid_base64(self):
-        """Test that invalid base64 content raises error."""
-        with self.assertRaises(ValidationError) as context:
-            Base64FileRequest(
-                filename="test.pdf",
-                file_content="not valid base64!!!"
-            )
-        self.assertIn("must be valid base64", str(context.exception))
-
-    def test_empty_filename(self):
-        """Test that empty filename raises error."""
-        with self.assertRaises(ValidationError):
-            Base64FileRequest(
-                filename="",
-                file_content=self.valid_base64
-            )
-
-    def test_missing_fields(self):
-        """Test that missing required fields raise errors."""
-        with self.assertRaises(ValidationError):
-            Base64FileRequest(filename="test.pdf")
-
-        with self.assertRaises(ValidationError):
-            Base64FileRequest(file_content=self.valid_base64)
-
-    def test_hebrew_filename(self):
-        """Test that non-ASCII filenames work."""
-        request = Base64FileRequest(
-            filename="מסמך.pdf",
-            file_content=self.valid_base64
-        )
-        self.assertEqual(request.filename, "מסמך.pdf")
+# Base64FileRequest
 
-    def test_model_dump(self):
-        """Test that model can be serialized to dict."""
-        request = Base64FileRequest(
-            filename="test.pdf",
-            file_content=self.valid_base64
+def test_valid_request(valid_base64):
+    """Test creating request with valid data."""
+    request = Base64FileRequest(
+        filename="test.pdf",
+        file_content=valid_base64
+    )
+    assert request.filename == "test.pdf"
+    assert request.file_content == valid_base64
+
+
+def test_filename_without_pdf_extension(valid_base64):
+    """Test that filename must end with .pdf."""
+    with pytest.raises(ValidationError, match="must end with .pdf"):
+        Base64FileRequest(
+            filename="test.txt",
+            file_content=valid_base64
         )
-        dumped = request.model_dump()
-        self.assertEqual(dumped['filename'], "test.pdf")
-        self.assertEqual(dumped['file_content'], self.valid_base64)
 
 
-class TestExtractionResponse(unittest.TestCase):
-    """Test cases for ExtractionResponse model."""
+def test_filename_case_insensitive(valid_base64):
+    """Test that .PDF extension works (case insensitive)."""
+    request = Base64FileRequest(
+        filename="test.PDF",
+        file_content=valid_base64
+    )
+    assert request.filename == "test.PDF"
 
-    def test_valid_response(self):
-        """Test creating response with valid data."""
-        response = ExtractionResponse(
-            filename="test.pdf",
-            content="# Test Document\n\nThis is a test."
-        )
-        self.assertEqual(response.filename, "test.pdf")
-        self.assertEqual(response.content, "# Test Document\n\nThis is a test.")
 
-    def test_empty_content(self):
-        """Test that empty content is allowed."""
-        response = ExtractionResponse(
+def test_invalid_base64():
+    """Test that invalid base64 content raises error."""
+    with pytest.raises(ValidationError, match="must be valid base64"):
+        Base64FileRequest(
             filename="test.pdf",
-            content=""
+            file_content="not valid base64!!!"
         )
-        self.assertEqual(response.content, "")
 
-    def test_unicode_content(self):
-        """Test that Unicode content works."""
-        hebrew_content = "# כותרת\n\nתוכן בעברית"
-        response = ExtractionResponse(
-            filename="test.pdf",
-            content=hebrew_content
-        )
-        self.assertEqual(response.content, hebrew_content)
 
-    def test_missing_fields(self):
-        """Test that missing required fields raise errors."""
-        with self.assertRaises(ValidationError):
-            ExtractionResponse(filename="test.pdf")
+def test_empty_filename(valid_base64):
+    """Test that empty filename raises error."""
+    with pytest.raises(ValidationError):
+        Base64FileRequest(
+            filename="",
+            file_content=valid_base64
+        )
 
-        with self.assertRaises(ValidationError):
-            ExtractionResponse(content="content")
 
-    def test_model_dump(self):
-        """Test that model can be serialized to dict."""
-        response = ExtractionResponse(
-            filename="test.pdf",
-            content="Test content"
-        )
-        dumped = response.model_dump()
-        self.assertEqual(dumped['filename'], "test.pdf")
-        self.assertEqual(dumped['content'], "Test content")
+def test_request_missing_fields(valid_base64):
+    """Test that missing required fields raise errors."""
+    with pytest.raises(ValidationError):
+        Base64FileRequest(filename="test.pdf")
 
-    def test_json_serialization(self):
-        """Test that model can be serialized to JSON."""
-        response = ExtractionResponse(
-            filename="test.pdf",
-            content="Test content"
-        )
-        json_str = response.model_dump_json()
-        self.assertIn("test.pdf", json_str)
-        self.assertIn("Test content", json_str)
+    with pytest.raises(ValidationError):
+        Base64FileRequest(file_content=valid_base64)
 
 
-if __name__ == '__main__':
-    unittest.main()
+def test_hebrew_filename(valid_base64):
+    """Test that non-ASCII filenames work."""
+    request = Base64FileRequest(
+        filename="מסמך.pdf",
+        file_content=valid_base64
+    )
+    assert request.filename == "מסמך.pdf"
+
+
+def test_request_model_dump(valid_base64):
+    """Test that model can be serialized to dict."""
+    request = Base64FileRequest(
+        filename="test.pdf",
+        file_content=valid_base64
+    )
+    dumped = request.model_dump()
+    assert dumped['filename'] == "test.pdf"
+    assert dumped['file_content'] == valid_base64
+
+
+@pytest.fixture
+def base64_with_bad_middle() -> str:
+    """Base64 PDF payload with an invalid character far from either end."""
+    encoded = base64.b64encode(b"%PDF-1.4\n" + bytes(300)).decode('ascii')
+    middle = len(encoded) // 2
+    return encoded[:middle] + "!" + encoded[middle + 1:]
+
+
+def test_invalid_base64_in_middle(base64_with_bad_middle):
+    """Test that an invalid character anywhere in the payload fails request validation."""
+    with pytest.raises(ValidationError, match="must be valid base64"):
+        Base64FileRequest(filename="test.pdf", file_content=base64_with_bad_middle)
+
+
+async def test_invalid_base64_in_middle_rejected_by_handler(base64_with_bad_middle):
+    """Test the handler's strict decode also rejects it, for callers that skip the model."""
+    handler = PDFInputHandler()
+    try:
+        with pytest.raises(FileEncodingError, match="Failed to decode PDF from base64"):
+            await handler.save_base64_file(base64_with_bad_middle, "test.pdf")
+        assert handler.temp_files == []
+    finally:
+        await handler.cleanup()
+
+
+# ExtractionResponse
+
+def test_valid_response():
+    """Test creating response with valid data."""
+    response = ExtractionResponse(
+        filename="test.pdf",
+        content="# Test Document\n\nThis is a test."
+    )
+    assert response.filename == "test.pdf"
+    assert response.content == "# Test Document\n\nThis is a test."
+
+
+def test_empty_content():
+    """Test that empty content is allowed."""
+    response = ExtractionResponse(
+        filename="test.pdf",
+        content=""
+    )
+    assert response.content == ""
+
+
+def test_unicode_content():
+    """Test that Unicode content works."""
+    hebrew_content = "# כותרת\n\nתוכן בעברית"
+    response = ExtractionResponse(
+        filename="test.pdf",
+        content=hebrew_content
+    )
+    assert response.content == hebrew_content
+
+
+def test_response_missing_fields():
+    """Test that missing required fields raise errors."""
+    with pytest.raises(ValidationError):
+        ExtractionResponse(filename="test.pdf")
+
+    with pytest.raises(ValidationError):
+        ExtractionResponse(content="content")
+
+
+def test_response_model_dump():
+    """Test that model can be serialized to dict."""
+    response = ExtractionResponse(
+        filename="test.pdf",
+        content="Test content"
+    )
+    dumped = response.model_dump()
+    assert dumped['filename'] == "test.pdf"
+    assert dumped['content'] == "Test content"
+
+
+def test_json_serialization():
+    """Test that model can be serialized to JSON."""
+    response = ExtractionResponse(
+        filename="test.pdf",
+        content="Test content"
+    )
+    json_str = response.model_dump_json()
+    assert "test.pdf" in json_str
+    assert "Test content" in json_str
@@ -4,25 +4,37 @@ Unit tests for ClientFactory.
 Tests the factory pattern, lazy loading, workflow mapping, and singleton behavior.
 """
 import unittest
-from unittest.mock import patch, MagicMock, PropertyMock
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import DEFAULT, AsyncMock, patch, MagicMock, PropertyMock
 
+import src.services.client_factory as client_factory_module
 from src.services.client_factory import ClientFactory, get_client_factory
 
 
 class TestClientFactory(unittest.TestCase):
     """Test cases for ClientFactory class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create the client instances returned by the patched constructors."""
+        # Tests only check identity and call counts, so one instance of each is reused
+        cls.mock_client = MagicMock()
+        cls.mock_processor = MagicMock()
+
     def setUp(self):
         """Set up test fixtures."""
         # Clear the global singleton before each test
-        import src.services.client_factory
-        src.services.client_factory._client_factory = None
+        client_factory_module._client_factory = None
+        self.mock_client.reset_mock()
+        self.mock_processor.reset_mock()
 
     def tearDown(self):
         """Clean up after tests."""
         # Clear the global singleton after each test
-        import src.services.client_factory
-        src.services.client_factory._client_factory = None
+        client_factory_module._client_factory = None
 
     # ============================================================================
     # Initialization Tests (2 tests)
@@ -52,7 +64,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.PDFProcessor')
     def test_pdf_processor_lazy_loading(self, mock_pdf_processor_class):
         """Test that pdf_processor is lazily initialized."""
-        mock_processor = MagicMock()
+        mock_processor = self.mock_processor
         mock_pdf_processor_class.return_value = mock_processor
 
         factory = ClientFactory()
@@ -72,7 +84,7 @@ class TestClientFactory(unittest.TestCase):
     def test_mistral_client_lazy_loading(self, mock_mistral_class, mock_settings):
         """Test that mistral_client is lazily initialized."""
         mock_settings.AZURE_API_KEY = "test_api_key"
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_mistral_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -90,7 +102,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.OpenAIDocumentClient')
     def test_openai_client_success(self, mock_openai_class):
         """Test successful OpenAI client initialization."""
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_openai_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -122,7 +134,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.AzureDocumentIntelligenceClient')
     def test_azure_di_client_success(self, mock_azure_di_class):
         """Test successful Azure DI client initialization."""
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_azure_di_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -140,7 +152,7 @@ class TestClientFactory(unittest.TestCase):
     def test_get_client_for_workflow_mistral(self, mock_mistral_class, mock_settings):
         """Test getting client for mistral workflow."""
         mock_settings.AZURE_API_KEY = "test_key"
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_mistral_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -151,7 +163,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.OpenAIDocumentClient')
     def test_get_client_for_workflow_openai(self, mock_openai_class):
         """Test getting client for openai workflow."""
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_openai_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -162,7 +174,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.GeminiDocumentClient')
     def test_get_client_for_workflow_gemini(self, mock_gemini_class):
         """Test getting client for gemini workflow."""
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_gemini_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -173,7 +185,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.GeminiDocumentClient')
     def test_get_client_for_workflow_gemini_wf(self, mock_gemini_class):
         """Test getting client for gemini-wf workflow (should use same client as gemini)."""
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_gemini_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -184,7 +196,7 @@ class TestClientFactory(unittest.TestCase):
     @patch('src.services.client_factory.AzureDocumentIntelligenceClient')
     def test_get_client_for_workflow_azure_di(self, mock_azure_di_class):
         """Test getting client for azure_document_intelligence workflow."""
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_azure_di_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -210,7 +222,7 @@ class TestClientFactory(unittest.TestCase):
     def test_client_caching(self, mock_mistral_class, mock_settings):
         """Test that clients are cached and not recreated on repeated access."""
         mock_settings.AZURE_API_KEY = "test_key"
-        mock_client = MagicMock()
+        mock_client = self.mock_client
         mock_mistral_class.return_value = mock_client
 
         factory = ClientFactory()
@@ -227,28 +239,70 @@ class TestClientFactory(unittest.TestCase):
         # Client should only be initialized once
         mock_mistral_class.assert_called_once()
 
-    @patch('src.services.client_factory.PDFProcessor')
-    @patch('src.services.client_factory.settings')
-    @patch('src.services.client_factory.MistralDocumentClient')
-    def test_init_only_once(self, mock_mistral_class, mock_settings, mock_pdf_processor_class):
+    def test_init_only_once(self):
         """Test that each client is only initialized once even with multiple property calls."""
-        mock_settings.AZURE_API_KEY = "test_key"
-        mock_mistral = MagicMock()
-        mock_processor = MagicMock()
-        mock_mistral_class.return_value = mock_mistral
-        mock_pdf_processor_class.return_value = mock_processor
+        with patch.multiple(
+            'src.services.client_factory',
+            PDFProcessor=DEFAULT,
+            settings=DEFAULT,
+            MistralDocumentClient=DEFAULT
+        ) as mocks:
+            mocks['settings'].AZURE_API_KEY = "test_key"
+
+            factory = ClientFactory()
+
+            # Access each property multiple times
+            _ = factory.pdf_processor
+            _ = factory.pdf_processor
+            _ = factory.mistral_client
+            _ = factory.mistral_client
+
+        # Each should only be initialized once
+        mocks['PDFProcessor'].assert_called_once()
+        mocks['MistralDocumentClient'].assert_called_once()
+
+    # ============================================================================
+    # Shutdown Tests (2 tests)
+    # ============================================================================
+
+    @patch('src.services.client_factory.AzureDocumentIntelligenceClient')
+    def test_close_closes_created_clients(self, mock_azure_di_class):
+        """Test close() closes the HTTP client of every client created so far."""
+        mock_azure_di_class.return_value.close = AsyncMock()
 
         factory = ClientFactory()
+        azure_di_client = factory.azure_document_intelligence_client
+        asyncio.run(factory.close())
 
-        # Access each property multiple times
-        _ = factory.pdf_processor
-        _ = factory.pdf_processor
-        _ = factory.mistral_client
-        _ = factory.mistral_client
+        azure_di_client.close.assert_awaited_once()
 
-        # Each should only be initialized once
-        mock_pdf_processor_class.assert_called_once()
-        mock_mistral_class.assert_called_once()
+    def test_close_without_clients(self):
+        """Test close() is a no-op when no client was created."""
+        factory = ClientFactory()
+
+        asyncio.run(factory.close())
+
+        self.assertIsNone(factory._azure_di_client)
+
+
+class TestImportBuildsNoClients(unittest.TestCase):
+    """Importing the app must not construct any client."""
+
+    def test_import_builds_no_clients(self):
+        """Test importing the app, extraction service and handlers leaves the factory unbuilt."""
+        # Fresh interpreter: this test process has already imported (and patched) these modules
+        code = (
+            "import main, src.services.extraction_service, src.services.workflows\n"
+            "from src.services import client_factory\n"
+            "assert client_factory._client_factory is None, 'client factory built at import'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,60 @@
+"""
+Unit tests for the default workflow handler's background cleanup.
+"""
+import unittest
+import tempfile
+import asyncio
+from pathlib import Path
+
+from src.services.pdf_processor import PDFProcessor
+from src.services.workflows import default_handler
+from src.services.workflows.default_handler import _run_in_background, drain_background_tasks
+
+
+class TestBackgroundCleanup(unittest.IsolatedAsyncioTestCase):
+    """Test cases for fire-and-forget chunk cleanup."""
+
+    async def test_drain_background_tasks_removes_chunk_files(self):
+        """Test draining waits for a scheduled cleanup so no chunk files are left."""
+        processor = PDFProcessor(max_pages_per_chunk=10)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            chunk_paths = []
+            for i in range(3):
+                path = Path(tmpdir) / f"chunk_{i}.pdf"
+                path.write_bytes(b"%PDF-1.4\nchunk")
+                chunk_paths.append(str(path))
+
+            _run_in_background(processor.cleanup_chunks(chunk_paths))
+            await drain_background_tasks()
+
+            for path in chunk_paths:
+                self.assertFalse(Path(path).exists())
+            self.assertEqual(len(default_handler._background_tasks), 0)
+
+    async def test_drain_background_tasks_waits_for_tasks_added_while_draining(self):
+        """Test tasks scheduled by a draining task are awaited too."""
+        finished = []
+
+        async def inner():
+            await asyncio.sleep(0)
+            finished.append("inner")
+
+        async def outer():
+            await asyncio.sleep(0)
+            _run_in_background(inner())
+            finished.append("outer")
+
+        _run_in_background(outer())
+        await drain_background_tasks()
+
+        self.assertEqual(finished, ["outer", "inner"])
+        self.assertEqual(len(default_handler._background_tasks), 0)
+
+    async def test_drain_background_tasks_no_pending(self):
+        """Test draining with nothing scheduled returns immediately."""
+        await drain_background_tasks()
+        self.assertEqual(len(default_handler._background_tasks), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,41 +1,22 @@
 #!/usr/bin/env python3
 """
-Simple standalone test for query filtering (no dependencies).
+Simple parametrized tests for query filtering.
 """
+import sys
+from pathlib import Path
 
+import pytest
 
-def filter_outlines_by_query(outline_info: list, query: str) -> list:
-    """
-    Filter outline sections by query string (case-insensitive partial match).
+# Add current directory to path (so it also runs as a script)
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-    Args:
-        outline_info: List of outline metadata dicts
-        query: Search query string
+from src.core.utils import filter_outlines_by_query
 
-    Returns:
-        Filtered list of outline metadata, or original list if no matches found
-    """
-    if not outline_info or not query:
-        return outline_info
 
-    query_lower = query.lower()
-    filtered = [
-        outline for outline in outline_info
-        if query_lower in outline['title'].lower()
-    ]
-
-    # If no matches found, return all outlines (fallback)
-    return filtered if filtered else outline_info
-
-
-def test_filter_function():
-    """Run manual tests on the filter function."""
-    print("="*80)
-    print("QUERY FILTER TESTS")
-    print("="*80)
-
-    # Sample outline metadata
-    outline_info = [
+@pytest.fixture(scope="module")
+def outline_info():
+    """Sample outline metadata, built once for the module."""
+    return [
         {
             'title': 'דוחות כספיים',
             'page': 0,
@@ -58,70 +39,34 @@ def test_filter_function():
         }
     ]
 
-    tests = [
-        ("Filter by 'דוחות כספיים' (default)", "דוחות כספיים", 1, ['דוחות כספיים']),
-        ("Filter by 'דוח דירקטוריון'", "דוח דירקטוריון", 1, ['דוח דירקטוריון']),
-        ("Filter partial match 'דוח'", "דוח", 2, ['דוחות כספיים', 'דוח דירקטוריון']),
-        ("Filter case-insensitive 'financial'", "financial", 1, ['Financial Reports']),
-        ("No match returns all", "nonexistent", 4, None),
-        ("Empty query returns all", "", 4, None),
-        ("None query returns all", None, 4, None),
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test_name, query, expected_count, expected_titles in tests:
-        print(f"\n{test_name}")
-        print(f"  Query: '{query}'")
-
-        result = filter_outlines_by_query(outline_info, query)
 
-        print(f"  Expected count: {expected_count}, Got: {len(result)}")
+@pytest.mark.parametrize("query,expected_count,expected_titles", [
+    pytest.param("דוחות כספיים", 1, ['דוחות כספיים'], id="default-query"),
+    pytest.param("דוח דירקטוריון", 1, ['דוח דירקטוריון'], id="directors-report"),
+    pytest.param("דוח", 2, ['דוחות כספיים', 'דוח דירקטוריון'], id="partial-match"),
+    pytest.param("financial", 1, ['Financial Reports'], id="case-insensitive"),
+    pytest.param("nonexistent", 4, None, id="no-match-returns-all"),
+    pytest.param("", 4, None, id="empty-query-returns-all"),
+    pytest.param(None, 4, None, id="none-query-returns-all"),
+])
+def test_filter(outline_info, query, expected_count, expected_titles):
+    """Filter the sample outlines and check the matched titles."""
+    result = filter_outlines_by_query(outline_info, query)
 
-        if len(result) == expected_count:
-            if expected_titles:
-                actual_titles = [r['title'] for r in result]
-                if actual_titles == expected_titles:
-                    print("  ✅ PASS")
-                    passed += 1
-                else:
-                    print(f"  ❌ FAIL - Expected titles: {expected_titles}, Got: {actual_titles}")
-                    failed += 1
-            else:
-                print("  ✅ PASS")
-                passed += 1
-        else:
-            print(f"  ❌ FAIL")
-            failed += 1
+    assert len(result) == expected_count
+    if expected_titles:
+        assert [r['title'] for r in result] == expected_titles
 
-    # Test with None outline_info
-    print(f"\nTest with None outline_info")
-    result = filter_outlines_by_query(None, "query")
-    if result is None:
-        print("  ✅ PASS")
-        passed += 1
-    else:
-        print("  ❌ FAIL")
-        failed += 1
 
-    # Test with empty outline_info
-    print(f"\nTest with empty outline_info")
-    result = filter_outlines_by_query([], "query")
-    if result == []:
-        print("  ✅ PASS")
-        passed += 1
-    else:
-        print("  ❌ FAIL")
-        failed += 1
+def test_filter_none_outline_info():
+    """None outline_info is returned unchanged."""
+    assert filter_outlines_by_query(None, "query") is None
 
-    print("\n" + "="*80)
-    print(f"SUMMARY: {passed} passed, {failed} failed out of {passed + failed} tests")
-    print("="*80)
 
-    return failed == 0
+def test_filter_empty_outline_info():
+    """Empty outline_info is returned unchanged."""
+    assert filter_outlines_by_query([], "query") == []
 
 
 if __name__ == "__main__":
-    success = test_filter_function()
-    exit(0 if success else 1)
+    raise SystemExit(pytest.main([__file__, "-q"]))
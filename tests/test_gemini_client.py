@@ -8,9 +8,11 @@ for PDF content extraction. Tests cover:
 - Content extraction with Gemini API
 - Error handling
 """
+import copy
 import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import DEFAULT, Mock, patch, MagicMock
 from pathlib import Path
+from types import SimpleNamespace
 import os
 
 from src.services.gemini_client import GeminiDocumentClient
@@ -19,18 +21,42 @@ from src.services.gemini_client import GeminiDocumentClient
 class TestGeminiDocumentClient(unittest.TestCase):
     """Test cases for Gemini Document Client."""
 
+    test_api_key = "test_gemini_api_key_12345"
+    test_model = "gemini-2.5-flash"
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one client with patched settings and genai.Client; tests get copies."""
+        with patch('src.services.gemini_client.settings') as mock_settings, \
+                patch('src.services.gemini_client.genai.Client'):
+            mock_settings.GEMINI_MODEL = cls.test_model
+            cls._proto_client = GeminiDocumentClient(api_key=cls.test_api_key)
+
     def setUp(self):
         """Set up test fixtures."""
-        self.test_api_key = "test_gemini_api_key_12345"
-        self.test_model = "gemini-2.5-flash"
+        # Patch the gemini_client module names once per test instead of per-method decorators
+        module_patch = patch.multiple(
+            'src.services.gemini_client',
+            settings=DEFAULT,
+            genai=DEFAULT,
+            fitz=DEFAULT,
+            types=DEFAULT,
+            logger=DEFAULT
+        )
+        self.mocks = module_patch.start()
+        self.addCleanup(module_patch.stop)
+
+        # Shallow copy of the prototype with its own Gemini API stub
+        self.client = copy.copy(self._proto_client)
+        self.client.client = SimpleNamespace(models=SimpleNamespace(generate_content=Mock()))
 
     # ========== Initialization Tests ==========
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    def test_init_with_default_settings(self, mock_genai_client, mock_settings):
+    def test_init_with_default_settings(self):
         """Test client initializes with settings from config."""
         # Setup
+        mock_settings = self.mocks['settings']
+        mock_genai_client = self.mocks['genai'].Client
         mock_settings.GEMINI_API_KEY = self.test_api_key
         mock_settings.GEMINI_MODEL = self.test_model
 
@@ -44,9 +70,10 @@ class TestGeminiDocumentClient(unittest.TestCase):
         # Verify genai.Client was created with API key
         mock_genai_client.assert_called_once_with(api_key=self.test_api_key)
 
-    @patch('src.services.gemini_client.genai.Client')
-    def test_init_with_custom_parameters(self, mock_genai_client):
+    def test_init_with_custom_parameters(self):
         """Test client initializes with custom parameters overriding settings."""
+        mock_genai_client = self.mocks['genai'].Client
+
         custom_key = "custom_api_key"
         custom_model = "gemini-1.5-pro"
 
@@ -62,11 +89,11 @@ class TestGeminiDocumentClient(unittest.TestCase):
         mock_genai_client.assert_called_once_with(api_key=custom_key)
 
     @patch.dict(os.environ, {'GEMINI_API_KEY': 'env_test_key'})
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    def test_init_with_env_variable(self, mock_genai_client, mock_settings):
+    def test_init_with_env_variable(self):
         """Test client uses environment variable when settings return None."""
         # Setup
+        mock_settings = self.mocks['settings']
+        mock_genai_client = self.mocks['genai'].Client
         mock_settings.GEMINI_API_KEY = None  # Force use of env var
         mock_settings.GEMINI_MODEL = self.test_model
 
@@ -77,11 +104,11 @@ class TestGeminiDocumentClient(unittest.TestCase):
         self.assertEqual(client.api_key, 'env_test_key')
         mock_genai_client.assert_called_once_with(api_key='env_test_key')
 
-    @patch('src.services.gemini_client.settings')
     @patch.dict(os.environ, {}, clear=True)
-    def test_init_missing_api_key_raises_error(self, mock_settings):
+    def test_init_missing_api_key_raises_error(self):
         """Test initialization fails when API key is not provided."""
         # Setup
+        mock_settings = self.mocks['settings']
         mock_settings.GEMINI_API_KEY = None
 
         # Execute & Assert
@@ -93,13 +120,10 @@ class TestGeminiDocumentClient(unittest.TestCase):
 
     # ========== PDF Page Extraction Tests ==========
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.fitz')
-    def test_extract_single_page_pdf_success(self, mock_fitz, mock_genai_client, mock_settings):
+    def test_extract_single_page_pdf_success(self):
         """Test successful extraction of single page from PDF."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
+        mock_fitz = self.mocks['fitz']
 
         # Mock PDF document with 3 pages
         mock_source_doc = MagicMock()
@@ -112,9 +136,8 @@ class TestGeminiDocumentClient(unittest.TestCase):
         mock_fitz.open.side_effect = [mock_source_doc, mock_target_doc]
 
         # Execute
-        client = GeminiDocumentClient()
         pdf_bytes = b'%PDF-1.4 test multi-page PDF'
-        result = client._extract_single_page_pdf(pdf_bytes, page_number=1)
+        result = self.client._extract_single_page_pdf(pdf_bytes, page_number=1)
 
         # Assert
         self.assertEqual(result, b'single_page_pdf_bytes')
@@ -133,13 +156,10 @@ class TestGeminiDocumentClient(unittest.TestCase):
         mock_source_doc.close.assert_called_once()
         mock_target_doc.close.assert_called_once()
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.fitz')
-    def test_extract_single_page_pdf_invalid_page(self, mock_fitz, mock_genai_client, mock_settings):
+    def test_extract_single_page_pdf_invalid_page(self):
         """Test error handling for invalid page number."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
+        mock_fitz = self.mocks['fitz']
 
         # Mock PDF with 3 pages
         mock_doc = MagicMock()
@@ -147,21 +167,16 @@ class TestGeminiDocumentClient(unittest.TestCase):
         mock_fitz.open.return_value = mock_doc
 
         # Execute & Assert
-        client = GeminiDocumentClient()
         with self.assertRaises(ValueError) as context:
-            client._extract_single_page_pdf(b'test_pdf', page_number=5)
+            self.client._extract_single_page_pdf(b'test_pdf', page_number=5)
 
         self.assertIn("Page 5 does not exist", str(context.exception))
         self.assertIn("PDF has 3 pages", str(context.exception))
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.fitz')
-    def test_extract_single_page_pdf_first_page(self, mock_fitz, mock_genai_client, mock_settings):
+    def test_extract_single_page_pdf_first_page(self):
         """Test extracting first page (page 0)."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
-
+        mock_fitz = self.mocks['fitz']
         mock_source_doc = MagicMock()
         mock_source_doc.__len__.return_value = 5
         mock_target_doc = MagicMock()
@@ -169,8 +184,7 @@ class TestGeminiDocumentClient(unittest.TestCase):
         mock_fitz.open.side_effect = [mock_source_doc, mock_target_doc]
 
         # Execute
-        client = GeminiDocumentClient()
-        result = client._extract_single_page_pdf(b'test_pdf', page_number=0)
+        result = self.client._extract_single_page_pdf(b'test_pdf', page_number=0)
 
         # Assert
         self.assertEqual(result, b'first_page')
@@ -180,14 +194,10 @@ class TestGeminiDocumentClient(unittest.TestCase):
             to_page=0
         )
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.fitz')
-    def test_extract_single_page_pdf_last_page(self, mock_fitz, mock_genai_client, mock_settings):
+    def test_extract_single_page_pdf_last_page(self):
         """Test extracting last page."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
-
+        mock_fitz = self.mocks['fitz']
         mock_source_doc = MagicMock()
         mock_source_doc.__len__.return_value = 5  # Pages 0-4
         mock_target_doc = MagicMock()
@@ -195,8 +205,7 @@ class TestGeminiDocumentClient(unittest.TestCase):
         mock_fitz.open.side_effect = [mock_source_doc, mock_target_doc]
 
         # Execute
-        client = GeminiDocumentClient()
-        result = client._extract_single_page_pdf(b'test_pdf', page_number=4)
+        result = self.client._extract_single_page_pdf(b'test_pdf', page_number=4)
 
         # Assert
         self.assertEqual(result, b'last_page')
@@ -208,40 +217,32 @@ class TestGeminiDocumentClient(unittest.TestCase):
 
     # ========== Content Extraction Tests ==========
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch.object(GeminiDocumentClient, '_extract_single_page_pdf')
-    def test_extract_page_content_success(self, mock_extract_page, mock_genai_client_class, mock_settings):
+    def test_extract_page_content_success(self):
         """Test successful content extraction from PDF page."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
-        mock_settings.GEMINI_MODEL = self.test_model
+        mock_settings = self.mocks['settings']
         mock_settings.get_system_prompt.return_value = "You are a helpful assistant."
         mock_settings.get_user_prompt_template.return_value = "Extract page {page_number}"
 
-        # Mock Gemini client
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "# Test Markdown\n\nExtracted content from Gemini"
-        mock_client.models.generate_content.return_value = mock_response
-        mock_genai_client_class.return_value = mock_client
+        # Mock Gemini response
+        mock_response = SimpleNamespace(text="# Test Markdown\n\nExtracted content from Gemini")
+        self.client.client.models.generate_content.return_value = mock_response
 
         # Mock page extraction
-        mock_extract_page.return_value = b'single_page_pdf_bytes'
+        self.client._extract_single_page_pdf = Mock(return_value=b'single_page_pdf_bytes')
 
         # Execute
-        client = GeminiDocumentClient()
-        result = client.extract_page_content(b'test_pdf_bytes', page_number=2)
+        result = self.client.extract_page_content(b'test_pdf_bytes', page_number=2)
 
         # Assert
         self.assertEqual(result, "# Test Markdown\n\nExtracted content from Gemini")
 
         # Verify page was extracted
-        mock_extract_page.assert_called_once_with(b'test_pdf_bytes', 2)
+        self.client._extract_single_page_pdf.assert_called_once_with(b'test_pdf_bytes', 2)
 
         # Verify API call
-        mock_client.models.generate_content.assert_called_once()
-        call_args = mock_client.models.generate_content.call_args
+        self.client.client.models.generate_content.assert_called_once()
+        call_args = self.client.client.models.generate_content.call_args
 
         # Check model name
         self.assertEqual(call_args.kwargs['model'], self.test_model)
@@ -251,32 +252,21 @@ class TestGeminiDocumentClient(unittest.TestCase):
         contents = call_args.kwargs['contents']
         self.assertEqual(len(contents), 2)  # PDF part + prompt
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.types.Part')
-    @patch.object(GeminiDocumentClient, '_extract_single_page_pdf')
-    def test_extract_page_content_uses_pdf_mime_type(
-        self, mock_extract_page, mock_part, mock_genai_client_class, mock_settings
-    ):
+    def test_extract_page_content_uses_pdf_mime_type(self):
         """Test content extraction uses correct PDF MIME type."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
+        mock_settings = self.mocks['settings']
+        mock_part = self.mocks['types'].Part
         mock_settings.get_system_prompt.return_value = "Prompt"
         mock_settings.get_user_prompt_template.return_value = "Extract {page_number}"
 
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "Test"
-        mock_client.models.generate_content.return_value = mock_response
-        mock_genai_client_class.return_value = mock_client
+        mock_response = SimpleNamespace(text="Test")
+        self.client.client.models.generate_content.return_value = mock_response
 
-        mock_extract_page.return_value = b'pdf_bytes'
-        mock_part_instance = MagicMock()
-        mock_part.from_bytes.return_value = mock_part_instance
+        self.client._extract_single_page_pdf = Mock(return_value=b'pdf_bytes')
 
         # Execute
-        client = GeminiDocumentClient()
-        client.extract_page_content(b'test', page_number=0)
+        self.client.extract_page_content(b'test', page_number=0)
 
         # Assert
         mock_part.from_bytes.assert_called_once_with(
@@ -284,69 +274,51 @@ class TestGeminiDocumentClient(unittest.TestCase):
             mime_type='application/pdf'
         )
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch.object(GeminiDocumentClient, '_extract_single_page_pdf')
-    def test_extract_page_content_prompt_formatting(
-        self, mock_extract_page, mock_genai_client_class, mock_settings
-    ):
+    def test_extract_page_content_prompt_formatting(self):
         """Test page number is correctly formatted in prompt (1-based)."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
+        mock_settings = self.mocks['settings']
         mock_settings.get_system_prompt.return_value = "System"
         mock_settings.get_user_prompt_template.return_value = "Page {page_number} content"
 
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "Test"
-        mock_client.models.generate_content.return_value = mock_response
-        mock_genai_client_class.return_value = mock_client
+        mock_response = SimpleNamespace(text="Test")
+        self.client.client.models.generate_content.return_value = mock_response
 
-        mock_extract_page.return_value = b'pdf'
+        self.client._extract_single_page_pdf = Mock(return_value=b'pdf')
 
         # Execute - request page 5 (0-based)
-        client = GeminiDocumentClient()
-        client.extract_page_content(b'test', page_number=5)
+        self.client.extract_page_content(b'test', page_number=5)
 
         # Assert - should be formatted as page 6 (1-based)
-        call_args = mock_client.models.generate_content.call_args
+        call_args = self.client.client.models.generate_content.call_args
         contents = call_args.kwargs['contents']
 
         # The prompt should be the last item (after PDF part)
         prompt = contents[-1]
         self.assertIn("Page 6 content", prompt)
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch.object(GeminiDocumentClient, '_extract_single_page_pdf')
-    def test_extract_page_content_combines_prompts(
-        self, mock_extract_page, mock_genai_client_class, mock_settings
-    ):
+    def test_extract_page_content_combines_prompts(self):
         """Test system and user prompts are combined with newlines."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
+        mock_settings = self.mocks['settings']
         custom_system = "Custom system instructions"
         custom_user = "Custom user prompt for page {page_number}"
         mock_settings.get_system_prompt.return_value = custom_system
         mock_settings.get_user_prompt_template.return_value = custom_user
 
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "Test"
-        mock_client.models.generate_content.return_value = mock_response
-        mock_genai_client_class.return_value = mock_client
+        mock_response = SimpleNamespace(text="Test")
+        self.client.client.models.generate_content.return_value = mock_response
 
-        mock_extract_page.return_value = b'pdf'
+        self.client._extract_single_page_pdf = Mock(return_value=b'pdf')
 
         # Execute
-        client = GeminiDocumentClient()
-        client.extract_page_content(b'test', page_number=0)
+        self.client.extract_page_content(b'test', page_number=0)
 
         # Assert
         mock_settings.get_system_prompt.assert_called_with("gemini")
         mock_settings.get_user_prompt_template.assert_called_with("gemini")
 
-        call_args = mock_client.models.generate_content.call_args
+        call_args = self.client.client.models.generate_content.call_args
         contents = call_args.kwargs['contents']
         full_prompt = contents[-1]
 
@@ -355,28 +327,17 @@ class TestGeminiDocumentClient(unittest.TestCase):
         self.assertIn("Custom user prompt for page 1", full_prompt)
         self.assertIn("\n\n", full_prompt)  # Prompts separated by newlines
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.logger')
-    @patch.object(GeminiDocumentClient, '_extract_single_page_pdf')
-    def test_extract_page_content_logs_progress(
-        self, mock_extract_page, mock_logger, mock_genai_client_class, mock_settings
-    ):
+    def test_extract_page_content_logs_progress(self):
         """Test extraction logs start and completion messages."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
+        mock_logger = self.mocks['logger']
+        mock_response = SimpleNamespace(text="Test content with 123 characters total")
+        self.client.client.models.generate_content.return_value = mock_response
 
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = "Test content with 123 characters total"
-        mock_client.models.generate_content.return_value = mock_response
-        mock_genai_client_class.return_value = mock_client
-
-        mock_extract_page.return_value = b'pdf'
+        self.client._extract_single_page_pdf = Mock(return_value=b'pdf')
 
         # Execute
-        client = GeminiDocumentClient()
-        client.extract_page_content(b'test', page_number=3)
+        self.client.extract_page_content(b'test', page_number=3)
 
         # Assert logging calls
         log_calls = [call[0][0] for call in mock_logger.info.call_args_list]
@@ -388,27 +349,17 @@ class TestGeminiDocumentClient(unittest.TestCase):
         self.assertTrue(any("Successfully extracted page 3" in msg for msg in log_calls))
         self.assertTrue(any("chars" in msg for msg in log_calls))
 
-    @patch('src.services.gemini_client.settings')
-    @patch('src.services.gemini_client.genai.Client')
-    @patch('src.services.gemini_client.logger')
-    @patch.object(GeminiDocumentClient, '_extract_single_page_pdf')
-    def test_extract_page_content_api_failure(
-        self, mock_extract_page, mock_logger, mock_genai_client_class, mock_settings
-    ):
+    def test_extract_page_content_api_failure(self):
         """Test error handling when Gemini API fails."""
         # Setup
-        mock_settings.GEMINI_API_KEY = self.test_api_key
-
-        mock_client = MagicMock()
-        mock_client.models.generate_content.side_effect = Exception("Gemini API error")
-        mock_genai_client_class.return_value = mock_client
+        mock_logger = self.mocks['logger']
+        self.client.client.models.generate_content.side_effect = Exception("Gemini API error")
 
-        mock_extract_page.return_value = b'pdf'
+        self.client._extract_single_page_pdf = Mock(return_value=b'pdf')
 
         # Execute & Assert
-        client = GeminiDocumentClient()
         with self.assertRaises(Exception) as context:
-            client.extract_page_content(b'test', page_number=2)
+            self.client.extract_page_content(b'test', page_number=2)
 
         self.assertIn("Gemini API error", str(context.exception))
 
@@ -4,12 +4,15 @@ Unit tests for Mistral API client.
 import unittest
 from unittest.mock import Mock, patch, AsyncMock
 import base64
+import functools
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 
 import httpx
 from pydantic import ValidationError
 
+from src.core.utils import encode_pdf_to_base64
 from src.services.mistral_client import MistralDocumentClient
 from src.models.mistral_models import (
     MistralOCRRequest,
@@ -20,10 +23,110 @@ from src.models.mistral_models import (
     UsageInfo
 )
 
+# The real class, captured before the tests patch httpx.AsyncClient (a Mock can't be a spec)
+_ASYNC_CLIENT_SPEC = httpx.AsyncClient
+
+# Placeholder PDF content written once per test class
+TEST_PDF_CONTENT = b"%PDF-1.4\ntest"
+
+# Mistral API response bodies, shared by the tests (never mutated)
+_SINGLE_PAGE_PAYLOAD = {
+    "model": "mistral-document-ai-2505",
+    "pages": [
+        {
+            "index": 0,
+            "markdown": "# Test Document\n\nContent here.",
+            "dimensions": {"dpi": 72, "height": 1000, "width": 800}
+        }
+    ],
+    "usage_info": {
+        "pages_processed": 1,
+        "doc_size_bytes": 100,
+        "pages_processed_annotation": 0
+    }
+}
+
+_TWO_PAGE_PAYLOAD = {
+    "model": "mistral-document-ai-2505",
+    "pages": [
+        {
+            "index": 0,
+            "markdown": "# Page 1\n\nFirst page content.",
+            "dimensions": {"dpi": 72, "height": 1000, "width": 800}
+        },
+        {
+            "index": 1,
+            "markdown": "# Page 2\n\nSecond page content.",
+            "dimensions": {"dpi": 72, "height": 1000, "width": 800}
+        }
+    ],
+    "usage_info": {
+        "pages_processed": 2,
+        "doc_size_bytes": 200,
+        "pages_processed_annotation": 0
+    }
+}
+
+_ERROR_PAYLOAD = {
+    "error": {
+        "message": "Invalid document format",
+        "type": "invalid_request_error",
+        "code": "invalid_document"
+    }
+}
+
+
+def _make_mock_client(status=200, exc=None, response=None):
+    """
+    Build an AsyncMock httpx client that also works as an async context manager.
+
+    The mock is specced on httpx.AsyncClient, so its request methods are
+    AsyncMocks and misspelled attributes raise AttributeError.
+
+    Args:
+        status: Status code of the default response
+        exc: Exception raised by get/post/request instead of returning a response
+        response: Response returned by get/post/request (default: a stub with status)
+
+    Returns:
+        AsyncMock to use as the patched AsyncClient's return_value
+    """
+    mock_client = AsyncMock(spec=_ASYNC_CLIENT_SPEC)
+    if response is None:
+        response = SimpleNamespace(status_code=status)
+    for method in (mock_client.get, mock_client.post, mock_client.request):
+        if exc is not None:
+            method.side_effect = exc
+        else:
+            method.return_value = response
+    mock_client.__aenter__.return_value = mock_client
+    return mock_client
+
 
 class TestMistralDocumentClient(unittest.IsolatedAsyncioTestCase):
     """Test cases for MistralDocumentClient class."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Write the placeholder PDF shared by the tests once."""
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
+            tmp.write(TEST_PDF_CONTENT)
+            cls.tmp_pdf_path = tmp.name
+
+        # process_document encodes the same file in every test; encode it once.
+        # test_encode_pdf_to_base64 imports the real encoder, which stays unpatched.
+        encoder_patch = patch(
+            'src.services.mistral_client.encode_pdf_to_base64',
+            new=functools.lru_cache(maxsize=8)(encode_pdf_to_base64)
+        )
+        encoder_patch.start()
+        cls.addClassCleanup(encoder_patch.stop)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared placeholder PDF."""
+        Path(cls.tmp_pdf_path).unlink(missing_ok=True)
+
     def setUp(self):
         """Set up test fixtures."""
         self.api_key = "test_api_key_12345"
@@ -54,23 +157,12 @@ class TestMistralDocumentClient(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(client.timeout, custom_timeout)
 
     def test_encode_pdf_to_base64(self):
-        """Test PDF to base64 encoding."""
-        # Create a temporary PDF-like file
-        test_content = b"%PDF-1.4\ntest content"
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(test_content)
-            tmp_path = tmp.name
-
-        try:
-            encoded = self.client._encode_pdf_to_base64(tmp_path)
+        """Test PDF to base64 encoding (the shared encoder process_document uses)."""
+        encoded = encode_pdf_to_base64(self.tmp_pdf_path)
 
-            # Verify it's base64 encoded
-            decoded = base64.b64decode(encoded)
-            self.assertEqual(decoded, test_content)
-
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        # Verify it's base64 encoded
+        decoded = base64.b64decode(encoded)
+        self.assertEqual(decoded, TEST_PDF_CONTENT)
 
     async def test_process_document_file_not_found(self):
         """Test processing raises error for non-existent file."""
@@ -80,151 +172,70 @@ class TestMistralDocumentClient(unittest.IsolatedAsyncioTestCase):
     @patch('httpx.AsyncClient')
     async def test_process_document_success(self, mock_client_class):
         """Test successful document processing."""
-        # Create a temporary PDF file
-        test_pdf_content = b"%PDF-1.4\ntest"
+        # Mock successful API response
+        mock_response = SimpleNamespace(
+            status_code=200,
+            json=Mock(return_value=_SINGLE_PAGE_PAYLOAD)
+        )
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(test_pdf_content)
-            tmp_path = tmp.name
-
-        try:
-            # Mock successful API response
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "model": "mistral-document-ai-2505",
-                "pages": [
-                    {
-                        "index": 0,
-                        "markdown": "# Test Document\n\nContent here.",
-                        "dimensions": {"dpi": 72, "height": 1000, "width": 800}
-                    }
-                ],
-                "usage_info": {
-                    "pages_processed": 1,
-                    "doc_size_bytes": 100,
-                    "pages_processed_annotation": 0
-                }
-            }
-
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
-
-            result, validation = await self.client.process_document(tmp_path)
-
-            # Verify result
-            self.assertIn("# Test Document", result)
-            self.assertIn("Content here.", result)
-
-            # Verify API was called
-            mock_client.post.assert_called_once()
-            call_args = mock_client.post.call_args
-            self.assertEqual(call_args[0][0], self.client.api_url)
-
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        mock_client = _make_mock_client(response=mock_response)
+        mock_client_class.return_value = mock_client
+
+        result, validation = await self.client.process_document(self.tmp_pdf_path)
+
+        # Verify result
+        self.assertIn("# Test Document", result)
+        self.assertIn("Content here.", result)
+
+        # Verify API was called (request_with_retry sends via client.request)
+        mock_client.request.assert_called_once()
+        call_args = mock_client.request.call_args
+        self.assertEqual(call_args[0], ("POST", self.client.api_url))
 
     @patch('httpx.AsyncClient')
     async def test_process_document_api_error(self, mock_client_class):
         """Test handling of API error response."""
-        # Create a temporary PDF file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(b"%PDF-1.4\ntest")
-            tmp_path = tmp.name
-
-        try:
-            # Mock error API response
-            mock_response = Mock()
-            mock_response.status_code = 400
-            mock_response.json.return_value = {
-                "error": {
-                    "message": "Invalid document format",
-                    "type": "invalid_request_error",
-                    "code": "invalid_document"
-                }
-            }
-            mock_response.text = '{"error": {"message": "Invalid document format"}}'
-
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
-
-            with self.assertRaises(ValueError) as context:
-                await self.client.process_document(tmp_path)
-
-            msg = str(context.exception)
-            if "Invalid document format" not in msg:
-                self.fail(f"Expected 'Invalid document format' in '{msg}'")
-
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        # Mock error API response
+        mock_response = SimpleNamespace(
+            status_code=400,
+            json=Mock(return_value=_ERROR_PAYLOAD),
+            text='{"error": {"message": "Invalid document format"}}'
+        )
+
+        mock_client = _make_mock_client(response=mock_response)
+        mock_client_class.return_value = mock_client
+
+        with self.assertRaises(ValueError) as context:
+            await self.client.process_document(self.tmp_pdf_path)
+
+        msg = str(context.exception)
+        if "Invalid document format" not in msg:
+            self.fail(f"Expected 'Invalid document format' in '{msg}'")
 
     @patch('httpx.AsyncClient')
     async def test_process_document_multiple_pages(self, mock_client_class):
         """Test processing document with multiple pages."""
-        # Create a temporary PDF file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp:
-            tmp.write(b"%PDF-1.4\ntest")
-            tmp_path = tmp.name
-
-        try:
-            # Mock API response with multiple pages
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "model": "mistral-document-ai-2505",
-                "pages": [
-                    {
-                        "index": 0,
-                        "markdown": "# Page 1\n\nFirst page content.",
-                        "dimensions": {"dpi": 72, "height": 1000, "width": 800}
-                    },
-                    {
-                        "index": 1,
-                        "markdown": "# Page 2\n\nSecond page content.",
-                        "dimensions": {"dpi": 72, "height": 1000, "width": 800}
-                    }
-                ],
-                "usage_info": {
-                    "pages_processed": 2,
-                    "doc_size_bytes": 200,
-                    "pages_processed_annotation": 0
-                }
-            }
-
-            mock_client = AsyncMock()
-            mock_client.post.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
-
-            result, validation = await self.client.process_document(tmp_path)
-
-            # Verify both pages are in result
-            self.assertIn("# Page 1", result)
-            self.assertIn("First page content", result)
-            self.assertIn("# Page 2", result)
-            self.assertIn("Second page content", result)
-
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        # Mock API response with multiple pages
+        mock_response = SimpleNamespace(
+            status_code=200,
+            json=Mock(return_value=_TWO_PAGE_PAYLOAD)
+        )
+
+        mock_client = _make_mock_client(response=mock_response)
+        mock_client_class.return_value = mock_client
+
+        result, validation = await self.client.process_document(self.tmp_pdf_path)
+
+        # Verify both pages are in result
+        self.assertIn("# Page 1", result)
+        self.assertIn("First page content", result)
+        self.assertIn("# Page 2", result)
+        self.assertIn("Second page content", result)
 
     @patch('httpx.AsyncClient')
     async def test_health_check_success(self, mock_client_class):
         """Test successful health check."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value = _make_mock_client(status=200)
 
         result = await self.client.health_check()
 
@@ -233,11 +244,7 @@ class TestMistralDocumentClient(unittest.IsolatedAsyncioTestCase):
     @patch('httpx.AsyncClient')
     async def test_health_check_failure(self, mock_client_class):
         """Test failed health check."""
-        mock_client = AsyncMock()
-        mock_client.get.side_effect = Exception("Connection failed")
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value = _make_mock_client(exc=Exception("Connection failed"))
 
         result = await self.client.health_check()
 
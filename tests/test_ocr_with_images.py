@@ -6,9 +6,11 @@ from src.models.mistral_models import MistralOCRResponse, Page, Dimensions, Usag
 @pytest.mark.asyncio
 async def test_process_ocr_with_images_with_images():
     # Mock Mistral client
-    with patch("src.services.extraction_service.mistral_client", new_callable=AsyncMock) as mock_mistral:
+    mock_mistral = AsyncMock()
+    with patch("src.services.extraction_service.get_mistral_client", return_value=mock_mistral):
         # Mock OpenAI client
-        with patch("src.services.extraction_service.openai_client") as mock_openai:
+        mock_openai = MagicMock()
+        with patch("src.services.extraction_service.get_openai_client", return_value=mock_openai):
             # Setup Mistral mock response
             mock_images = [{"image_base64": "fake_base64_data", "page_index": 0}]
             mock_metadata = {"images": mock_images}
@@ -47,9 +49,11 @@ async def test_process_ocr_with_images_with_images():
 @pytest.mark.asyncio
 async def test_process_ocr_with_images_no_images():
     # Mock Mistral client
-    with patch("src.services.extraction_service.mistral_client", new_callable=AsyncMock) as mock_mistral:
+    mock_mistral = AsyncMock()
+    with patch("src.services.extraction_service.get_mistral_client", return_value=mock_mistral):
         # Mock OpenAI client
-        with patch("src.services.extraction_service.openai_client") as mock_openai:
+        mock_openai = MagicMock()
+        with patch("src.services.extraction_service.get_openai_client", return_value=mock_openai):
             # Setup Mistral mock response (no images)
             mock_mistral.process_document.return_value = ("Mistral Content", {})
             
@@ -2,7 +2,7 @@
 Unit tests for query filtering functionality.
 """
 import unittest
-from src.core.utils import filter_outlines_by_query
+from src.core.utils import filter_outlines_by_query, filter_outlines_by_query_iter
 
 
 class TestQueryFilter(unittest.TestCase):
@@ -117,6 +117,44 @@ class TestQueryFilter(unittest.TestCase):
         self.assertEqual(result[1]['title'], 'Financial Report 2024')
         self.assertEqual(result[2]['title'], 'Annual Report')
 
+    def test_filter_folds_case_beyond_lower(self):
+        """Test that matching uses full case folding, not just lowercasing."""
+        outline_info = [
+            {'title': 'Hauptstraße Branch', 'page': 0, 'chunk_indices': [0]},
+            {'title': 'Summary', 'page': 10, 'chunk_indices': [1]}
+        ]
+
+        # 'ß'.lower() is still 'ß'; casefold() maps it to 'ss'
+        result = filter_outlines_by_query(outline_info, "STRASSE")
+
+        self.assertEqual(result, [outline_info[0]])
+
+    def test_filter_does_not_modify_outlines(self):
+        """Test that filtering leaves the caller's outline dicts unchanged."""
+        before = [dict(outline) for outline in self.outline_info]
+
+        filter_outlines_by_query(self.outline_info, "financial")
+
+        self.assertEqual(self.outline_info, before)
+
+    def test_filter_uses_current_title(self):
+        """Test that a title edited after an earlier filter is matched as edited."""
+        filter_outlines_by_query(self.outline_info, "financial")
+
+        self.outline_info[3]['title'] = 'Quarterly Summary'
+
+        self.assertEqual(filter_outlines_by_query(self.outline_info, "quarterly"), [self.outline_info[3]])
+        self.assertNotIn(self.outline_info[3], filter_outlines_by_query_iter(self.outline_info, "financial"))
+
+    def test_filter_iter_yields_matches(self):
+        """Test that the iterator yields matches lazily without the fallback."""
+        matches = filter_outlines_by_query_iter(self.outline_info, "דוח")
+
+        self.assertEqual(next(matches)['title'], 'דוחות כספיים')
+        self.assertEqual(next(matches)['title'], 'דוח דירקטוריון')
+        self.assertIsNone(next(matches, None))
+        self.assertFalse(any(filter_outlines_by_query_iter(self.outline_info, "nonexistent")))
+
 
 class TestQueryFilterIntegration(unittest.TestCase):
     """Integration tests for query filtering with API models."""
@@ -1,9 +1,15 @@
 """
 Unit tests for the validation service.
 """
+import subprocess
+import sys
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from src.services.validation import ValidationService, ValidationResult, CrossValidationReport
+from src.core.process_pool import shutdown_process_pools
+from src.core.similarity_calculator import score_similarity
+from src.services.validation.validation_orchestrator import _extract_cache, _document_id
 
 
 class TestProblemPatternDetection(unittest.TestCase):
@@ -370,6 +376,54 @@ class TestSimilarityDispatcher(unittest.TestCase):
         sim_lev = self.validation_service.calculate_similarity_levenshtein(content1, content2)
         self.assertLess(sim_lev, 0.5, "Different words should have low Levenshtein similarity")
 
+    def test_score_similarity_uses_passed_method(self):
+        """Test the pool worker scores with the method it is given, not the worker's settings."""
+        content1 = "Revenue: 1000"
+        content2 = "Income: 1000"
+
+        self.assertAlmostEqual(score_similarity(content1, content2, "number_frequency"), 1.0, places=5)
+        self.assertLess(score_similarity(content1, content2, "levenshtein"), 0.5)
+
+
+class TestSimilarityProcessPool(unittest.IsolatedAsyncioTestCase):
+    """Test cases for scoring similarity in the shared process pool."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.validation_service = ValidationService()
+        self.addCleanup(shutdown_process_pools)
+
+    @patch('src.services.validation.validation_orchestrator.settings')
+    async def test_pool_score_matches_in_process_score(self, mock_settings):
+        """Test a score computed in a spawned worker matches the in-process score."""
+        mock_settings.VALIDATION_SIMILARITY_USE_PROCESSES = True
+        mock_settings.VALIDATION_SIMILARITY_METHOD = "levenshtein"
+        content1 = "Revenue: 1000"
+        content2 = "Income: 1000"
+
+        with self.assertNoLogs('src.services.validation.validation_orchestrator', level='WARNING'):
+            similarity = await self.validation_service._calculate_similarity_async(content1, content2)
+
+        expected = self.validation_service.calculate_similarity_levenshtein(content1, content2)
+        self.assertAlmostEqual(similarity, expected, places=5)
+
+    def test_worker_module_does_not_import_services(self):
+        """Test the pool's entry point imports without src.services (and its client SDKs)."""
+        # Fresh interpreter, like a spawned worker
+        code = (
+            "import sys\n"
+            "from src.core.similarity_calculator import score_similarity\n"
+            "loaded = [name for name in sys.modules if name.startswith('src.services')]\n"
+            "assert not loaded, loaded\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+
 
 class TestSampleValidationLogic(unittest.TestCase):
     """Test cases for sample validation logic."""
@@ -377,6 +431,10 @@ class TestSampleValidationLogic(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.validation_service = ValidationService()
+        # Expectations below are written for a 1-in-10 sample rate (as in .env.example)
+        patcher = patch('src.services.validation.validation_orchestrator.settings.VALIDATION_SAMPLE_RATE', 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_no_validation_without_query(self):
         """Test that no validation happens without query filtering."""
@@ -385,13 +443,13 @@ class TestSampleValidationLogic(unittest.TestCase):
                 page_index=page_idx,
                 total_pages=100,
                 has_query=False,
-                random_offset=0
+                doc_id=0
             )
             self.assertFalse(result, f"Page {page_idx} should not be validated without query")
 
     def test_sample_rate_with_query(self):
         """Test that every 10th page is validated with query filtering."""
-        random_offset = 0
+        doc_id = 0
         sample_rate = 10
 
         validated_pages = []
@@ -400,7 +458,7 @@ class TestSampleValidationLogic(unittest.TestCase):
                 page_index=page_idx,
                 total_pages=100,
                 has_query=True,
-                random_offset=random_offset
+                doc_id=doc_id
             ):
                 validated_pages.append(page_idx)
 
@@ -408,29 +466,69 @@ class TestSampleValidationLogic(unittest.TestCase):
         expected_pages = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90]
         self.assertEqual(validated_pages, expected_pages, "Should validate every 10th page")
 
-    def test_random_offset_changes_sampling(self):
-        """Test that different random offsets change which pages are sampled."""
-        offset1 = 0
-        offset2 = 5
+    def test_doc_id_changes_sampling(self):
+        """Test that different document ids change which pages are sampled."""
+        doc_id1 = 0
+        doc_id2 = 5
 
-        # Get pages validated with offset 0
+        # Get pages validated for the first document
         pages1 = [
             i for i in range(100)
-            if self.validation_service.should_validate_page(i, 100, True, offset1)
+            if self.validation_service.should_validate_page(i, 100, True, doc_id1)
         ]
 
-        # Get pages validated with offset 5
+        # Get pages validated for the second document
         pages2 = [
             i for i in range(100)
-            if self.validation_service.should_validate_page(i, 100, True, offset2)
+            if self.validation_service.should_validate_page(i, 100, True, doc_id2)
         ]
 
         # Should be different pages
-        self.assertNotEqual(pages1, pages2, "Different offsets should sample different pages")
+        self.assertNotEqual(pages1, pages2, "Different documents should sample different pages")
         # But same number of pages
         self.assertEqual(len(pages1), len(pages2), "Should validate same number of pages")
 
 
+    def test_document_id_is_deterministic(self):
+        """Test that the sampling document id is stable for the same bytes."""
+        pdf_bytes = b"%PDF-1.4\n" + b"x" * 8192
+        self.assertEqual(_document_id(pdf_bytes), _document_id(pdf_bytes))
+        self.assertNotEqual(_document_id(pdf_bytes), _document_id(b"%PDF-1.4\nother"))
+
+
+class TestValidatorExtractionCache(unittest.IsolatedAsyncioTestCase):
+    """Test cases for caching validator extractions by page content."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        _extract_cache.clear()
+        self.validation_service = ValidationService()
+        self.validation_service.validator_client = Mock()
+        self.validation_service.validator_client.extract_page_content.return_value = "validator content"
+
+    def tearDown(self):
+        """Drop cached extractions between tests."""
+        _extract_cache.clear()
+
+    async def test_identical_page_hits_cache(self):
+        """Test that the same page bytes are only sent to the validator once."""
+        first = await self.validation_service._fetch_alternative(b"%PDF page", 0, [])
+        second = await self.validation_service._fetch_alternative(b"%PDF page", 0, [])
+
+        self.assertEqual(first, "validator content")
+        self.assertEqual(second, "validator content")
+        self.validation_service.validator_client.extract_page_content.assert_called_once()
+
+    async def test_different_prompt_misses_cache(self):
+        """Test that a different custom prompt triggers a new validator call."""
+        await self.validation_service._fetch_alternative(b"%PDF page", 0, [])
+        await self.validation_service._fetch_alternative(
+            b"%PDF page", 0, [], custom_system_prompt="image prompt"
+        )
+
+        self.assertEqual(self.validation_service.validator_client.extract_page_content.call_count, 2)
+
+
 class TestValidationResult(unittest.TestCase):
     """Test cases for ValidationResult data structure."""
 
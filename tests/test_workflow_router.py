@@ -0,0 +1,121 @@
+"""
+Unit tests for query-to-workflow routing.
+"""
+import unittest
+from unittest.mock import patch
+
+from src.core.config import settings
+from src.workflows import WorkflowType, classify_query, reset_routing_cache
+
+
+class TestWorkflowRouter(unittest.TestCase):
+    """Test cases for classify_query with a patched QUERY_WORKFLOW_MAPPING."""
+
+    def setUp(self):
+        """Route with a known mapping; routing state is rebuilt from it."""
+        patcher = patch.dict(settings.QUERY_WORKFLOW_MAPPING, {
+            "bank": "text_extraction",
+            "esna": "azure_document_intelligence",
+            "default": "mistral"
+        }, clear=True)
+        patcher.start()
+        self.addCleanup(reset_routing_cache)
+        self.addCleanup(patcher.stop)
+        reset_routing_cache()
+
+    def _use_mapping(self, mapping):
+        """Replace the patched mapping and rebuild the routing state from it."""
+        settings.QUERY_WORKFLOW_MAPPING.clear()
+        settings.QUERY_WORKFLOW_MAPPING.update(mapping)
+        reset_routing_cache()
+
+    def test_earlier_mapping_entry_wins_over_earlier_match(self):
+        """Test mapping order, not position in the query, decides between two matches."""
+        self._use_mapping({
+            "statements": "gemini",
+            "bank": "text_extraction",
+            "default": "mistral"
+        })
+
+        # "bank" occurs first in the query, but "statements" is listed first
+        self.assertEqual(classify_query("bank statements"), WorkflowType.GEMINI)
+        self.assertEqual(classify_query("bank only"), WorkflowType.TEXT_EXTRACTION)
+
+    def test_overlapping_patterns_follow_mapping_order(self):
+        """Test patterns matching at the same position resolve to the earlier entry."""
+        self._use_mapping({
+            "bank statements": "azure_document_intelligence",
+            "bank": "text_extraction",
+            "default": "mistral"
+        })
+        self.assertEqual(classify_query("bank statements 2024"), WorkflowType.AZURE_DOCUMENT_INTELLIGENCE)
+        self.assertEqual(classify_query("bank fees"), WorkflowType.TEXT_EXTRACTION)
+
+        self._use_mapping({
+            "bank": "text_extraction",
+            "bank statements": "azure_document_intelligence",
+            "default": "mistral"
+        })
+        self.assertEqual(classify_query("bank statements 2024"), WorkflowType.TEXT_EXTRACTION)
+
+    def test_patterns_match_case_insensitively(self):
+        """Test mixed-case patterns and queries match regardless of case."""
+        self._use_mapping({"05_Esna": "azure_document_intelligence", "default": "mistral"})
+
+        self.assertEqual(classify_query("05_esna"), WorkflowType.AZURE_DOCUMENT_INTELLIGENCE)
+        self.assertEqual(classify_query("REPORT 05_ESNA"), WorkflowType.AZURE_DOCUMENT_INTELLIGENCE)
+
+    def test_regex_metacharacters_match_literally(self):
+        """Test patterns are matched as plain substrings, not as regular expressions."""
+        self._use_mapping({
+            "a.b": "text_extraction",
+            "c++ (v2)": "gemini",
+            "[x]|y": "openai",
+            "default": "mistral"
+        })
+
+        self.assertEqual(classify_query("file a.b"), WorkflowType.TEXT_EXTRACTION)
+        self.assertEqual(classify_query("file axb"), WorkflowType.MISTRAL)
+        self.assertEqual(classify_query("c++ (v2) docs"), WorkflowType.GEMINI)
+        self.assertEqual(classify_query("cc (v2)"), WorkflowType.MISTRAL)
+        self.assertEqual(classify_query("[x]|y"), WorkflowType.OPENAI)
+        self.assertEqual(classify_query("x"), WorkflowType.MISTRAL)
+        self.assertEqual(classify_query("y"), WorkflowType.MISTRAL)
+
+    def test_empty_mapping_uses_default(self):
+        """Test a mapping with only the default entry routes every query to it."""
+        self._use_mapping({"default": "gemini"})
+
+        self.assertEqual(classify_query("bank statements"), WorkflowType.GEMINI)
+
+    def test_none_and_whitespace_queries_use_default(self):
+        """Test None, empty and whitespace-only queries fall back to the default workflow."""
+        for query in (None, "", " ", "   ", "\t\n"):
+            with self.subTest(query=query):
+                self.assertEqual(classify_query(query), WorkflowType.MISTRAL)
+
+    def test_surrounding_whitespace_is_ignored(self):
+        """Test a padded query still matches its pattern."""
+        self.assertEqual(classify_query("  bank  "), WorkflowType.TEXT_EXTRACTION)
+        self.assertEqual(classify_query("\tesna\n"), WorkflowType.AZURE_DOCUMENT_INTELLIGENCE)
+
+    def test_reset_routing_cache_picks_up_mapping_changes(self):
+        """Test a mapping change takes effect only after reset_routing_cache()."""
+        self.assertEqual(classify_query("bank statements"), WorkflowType.TEXT_EXTRACTION)
+        self.assertEqual(classify_query("random query"), WorkflowType.MISTRAL)
+
+        settings.QUERY_WORKFLOW_MAPPING["bank"] = "gemini"
+        settings.QUERY_WORKFLOW_MAPPING["default"] = "openai"
+
+        # Compiled matcher, default workflow and memoized results are still the old ones
+        self.assertEqual(classify_query("bank statements"), WorkflowType.TEXT_EXTRACTION)
+        self.assertEqual(classify_query("random query"), WorkflowType.MISTRAL)
+
+        reset_routing_cache()
+
+        self.assertEqual(classify_query("bank statements"), WorkflowType.GEMINI)
+        self.assertEqual(classify_query("random query"), WorkflowType.OPENAI)
+
+
+if __name__ == '__main__':
+    unittest.main()